@@ -1,8 +1,14 @@
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
 from flask_cors import CORS
 import scout
+import json
 import logging
+import multiprocessing
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 
 app = Flask(__name__)
 CORS(app) # Enable CORS for all routes (allows file:// access)
@@ -11,6 +17,14 @@ CORS(app) # Enable CORS for all routes (allows file:// access)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("WebApp")
 
+# Do the first scan's one-time setup (parsers, dateparser data, engine, stores)
+# while the server starts instead of inside the first request. Only in the
+# serving process: spawned parse workers re-import this module as __mp_main__,
+# and `python app.py` first runs it in the debug reloader's watcher process.
+_reloader_watcher = __name__ == '__main__' and not os.environ.get('WERKZEUG_RUN_MAIN')
+if multiprocessing.parent_process() is None and not _reloader_watcher:
+    threading.Thread(target=scout.warm_up, name="scout-warm-up", daemon=True).start()
+
 @app.route('/')
 def home():
     return render_template('index.html')
@@ -19,47 +33,158 @@ def home():
 def health():
     return jsonify({"status": "ok", "message": "Server is running!"})
 
+@app.route('/api/cache')
+def cache_stats():
+    return jsonify(scout.cache_stats())
+
+@app.route('/api/hosts')
+def hosts():
+    # Per-host latency percentiles, adaptive timeouts and circuit breaker state.
+    return jsonify(scout.host_stats())
+
+@app.route('/api/metrics')
+def metrics():
+    # Prometheus scrape target: per-stage scan timings, item and error counts.
+    return Response(scout.metrics_text(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/api/scan', methods=['POST'])
 def scan():
     data = request.json
     tickers = data.get('tickers', [])
     days = int(data.get('days', 7))
+    limit = int(data.get('limit', 100))
+    # Seconds per ticker; sources still running by then are left out.
+    deadline = float(data['deadline']) if data.get('deadline') else None
     
     logger.info(f"Scanning {tickers} for last {days} days")
     
     all_news = []
     
-    for ticker in tickers:
-        try:
-            ticker = ticker.strip().upper()
-            if not ticker: continue
-            
-            # 1. Find URL
-            url = scout.find_ir_page(ticker)
-            if not url:
-                all_news.append({
-                    'ticker': ticker,
-                    'error': 'Could not find Investor Relations page.'
-                })
-                continue
-                
-            # 2. Get News
-            news = scout.get_news(url, ticker, days_lookback=days)
-            if not news:
-                all_news.append({
-                    'ticker': ticker,
-                    'error': 'No recent news found in this timeframe.'
-                })
-            else:
-                all_news.extend(news)
-        except Exception as e:
-            logger.error(f"Error processing {ticker}: {e}")
+    # All tickers share one worker pool; results arrive as each finishes.
+    for result in scout.scan_many(tickers, days_lookback=days, limit=limit, deadline=deadline):
+        # Yahoo and Reddit news is kept even when no IR page was found.
+        if result['news']:
+            all_news.extend(result['news'])
+        elif result['error']:
             all_news.append({
-                'ticker': ticker,
-                'error': f"Internal Error: {str(e)}"
+                'ticker': result['ticker'],
+                'error': result['error']
+            })
+        else:
+            all_news.append({
+                'ticker': result['ticker'],
+                'error': 'No recent news found in this timeframe.'
             })
             
     return jsonify(all_news)
 
+@app.route('/api/scan/stream', methods=['POST'])
+def scan_stream():
+    """
+    Streaming variant of /api/scan. Emits one record per source result as
+    soon as it is ready, a 'ticker' record when a ticker is done, and a final
+    'summary' record with timings. Source records are not deduplicated across
+    sources; a ticker's 'count' and the summary's 'items' are the merged
+    totals /api/scan would return. NDJSON by default; Server-Sent Events with
+    ?format=sse or "Accept: text/event-stream".
+    """
+    data = request.json
+    tickers = data.get('tickers', [])
+    days = int(data.get('days', 7))
+    limit = int(data.get('limit', 100))
+    api_key = data.get('sec_api_key')
+    deadline = float(data['deadline']) if data.get('deadline') else None
+    sse = request.args.get('format') == 'sse' or 'text/event-stream' in request.headers.get('Accept', '')
+
+    logger.info(f"Streaming scan of {tickers} for last {days} days")
+
+    def records():
+        started = time.perf_counter()
+        first_result, items, errors, timings = None, 0, 0, {}
+        for event in scout.scan_events(tickers, days_lookback=days, api_key=api_key, limit=limit,
+                                       deadline=deadline):
+            if event['type'] == 'ticker':
+                # Items were already streamed per source; don't send them twice.
+                news = event.pop('news')
+                event.pop('filings')
+                event['count'] = len(news)
+                items += len(news)
+                if not event['error'] and not news:
+                    event['error'] = 'No recent news found in this timeframe.'
+                errors += bool(event['error'])
+                timings[event['ticker']] = event['elapsed']
+            else:
+                if first_result is None:
+                    first_result = round(time.perf_counter() - started, 3)
+            yield event
+        yield {
+            'type': 'summary', 'tickers': len(timings), 'items': items, 'errors': errors,
+            'first_result_after': first_result, 'elapsed': round(time.perf_counter() - started, 3),
+            'timings': timings
+        }
+
+    def encode():
+        for record in records():
+            if sse:
+                yield f"event: {record['type']}\ndata: {json.dumps(record)}\n\n"
+            else:
+                yield json.dumps(record) + "\n"
+
+    mimetype = 'text/event-stream' if sse else 'application/x-ndjson'
+    return Response(stream_with_context(encode()), mimetype=mimetype, headers={'Cache-Control': 'no-cache'})
+
+@app.route('/api/news')
+def news():
+    """
+    Pages through stored news without scraping:
+    /api/news?tickers=NVDA,AMD&days=365&limit=50&offset=100&sources=Official IR
+    """
+    tickers = [t.strip().upper() for t in request.args.get('tickers', '').split(',') if t.strip()]
+    if not tickers:
+        return jsonify({"error": "tickers is required"}), 400
+    days = request.args.get('days', 7, type=int)
+    limit = request.args.get('limit', 100, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    sources = [s for s in request.args.get('sources', '').split(',') if s] or None
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
+    items, total = scout.get_news_store().query(tickers, since, sources, limit, offset)
+    return jsonify({"total": total, "offset": offset, "limit": limit, "items": items})
+
+EXPORT_FORMATS = {'csv': 'text/csv', 'parquet': 'application/vnd.apache.parquet'}
+
+@app.route('/api/export', methods=['GET', 'POST'])
+def export():
+    """
+    Bulk news export as CSV or Parquet (?format=parquet, needs pyarrow).
+    GET reads the store with /api/news' parameters (no limit); POST scans
+    first and takes /api/scan's JSON body.
+    """
+    fmt = request.args.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": f"format must be one of {', '.join(EXPORT_FORMATS)}"}), 400
+    if request.method == 'POST':
+        data = request.json
+        tickers = data.get('tickers', [])
+        days = int(data.get('days', 7))
+        limit = int(data.get('limit', 100))
+        logger.info(f"Exporting a scan of {tickers} for last {days} days as {fmt}")
+        deadline = float(data['deadline']) if data.get('deadline') else None
+        batch = scout.news_batch(scout.scan_many(tickers, days_lookback=days, limit=limit, deadline=deadline))
+    else:
+        tickers = [t.strip().upper() for t in request.args.get('tickers', '').split(',') if t.strip()]
+        if not tickers:
+            return jsonify({"error": "tickers is required"}), 400
+        days = request.args.get('days', 7, type=int)
+        sources = [s for s in request.args.get('sources', '').split(',') if s] or None
+        since = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
+        batch = scout.get_news_store().query_batch(tickers, since, sources)
+    try:
+        body = batch.to_parquet() if fmt == 'parquet' else batch.to_csv()
+    except ImportError:
+        return jsonify({"error": "Parquet export needs pyarrow (pip install pyarrow)"}), 501
+    filename = f"news-{datetime.now(timezone.utc):%Y%m%d}.{fmt}"
+    return Response(body, mimetype=EXPORT_FORMATS[fmt],
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+
 if __name__ == '__main__':
     app.run(debug=True, port=5000)
@@ -0,0 +1,129 @@
+"""
+Cold-start benchmark: how long `import scout` / `import app` take in a fresh
+interpreter, and how much slower a process's first scan is than its second,
+with and without scout.warm_up() run beforehand. Scans go to the replay
+server, so nothing live is touched. Results are compared with
+benchmarks/cold_start.json (all numbers are lower-is-better):
+
+    python benchmarks/bench_cold_start.py
+    python benchmarks/bench_cold_start.py --update-baseline
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from bench_suite import RECORDED_AT
+
+BASELINE = os.path.join(BENCH_DIR, "cold_start.json")
+
+def import_ms(module, repeat):
+    """Median wall time of importing `module` in a fresh interpreter."""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    samples = [float(subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+                                    check=True).stdout) for _ in range(repeat)]
+    return round(statistics.median(samples) * 1000, 1)
+
+def run_child(replay_url, warm):
+    """One fresh process: optional warm_up, then two single-ticker scans."""
+    started = time.perf_counter()
+    import scout
+    import store
+    from replay_server import ReplayTransport
+    result = {'import_ms': round((time.perf_counter() - started) * 1000, 1)}
+    scout.HTTP_TRANSPORT = ReplayTransport(replay_url)
+    scout._google_ir_search = lambda ticker: None
+    workdir = tempfile.mkdtemp(prefix="scout-cold-")
+    store.DB_PATH = os.path.join(workdir, "scout.db")
+    scout.SEC_TICKERS_PATH = os.path.join(workdir, "company_tickers.json")
+    days = (datetime.now(timezone.utc) - RECORDED_AT).days + 365
+    if warm:
+        t0 = time.perf_counter()
+        scout.warm_up()
+        result['warm_up_ms'] = round((time.perf_counter() - t0) * 1000, 1)
+    for key, ticker in (('first_scan_ms', 'T001'), ('second_scan_ms', 'T002')):
+        t0 = time.perf_counter()
+        list(scout.scan_many([ticker], days_lookback=days))
+        result[key] = round((time.perf_counter() - t0) * 1000, 1)
+    return result
+
+def child_scans(replay_url, warm, repeat):
+    """Median of each child measurement over `repeat` fresh processes."""
+    runs = []
+    for _ in range(repeat):
+        cmd = [sys.executable, os.path.abspath(__file__), "--child", "--replay", replay_url]
+        if warm:
+            cmd.append("--warm")
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"cold-start child failed:\n{proc.stderr}")
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return {key: round(statistics.median(run[key] for run in runs), 1) for key in runs[0]}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed relative regression.")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--warm", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--replay", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.replay, args.warm)))
+        return
+
+    from replay_server import spawn_replay_server
+    proc, replay_url = spawn_replay_server(latency=args.latency)
+    try:
+        cold = child_scans(replay_url, False, args.repeat)
+        warm = child_scans(replay_url, True, args.repeat)
+    finally:
+        proc.terminate()
+    results = {
+        'import_scout_ms': import_ms("scout", args.repeat),
+        'import_app_ms': import_ms("app", args.repeat),
+        'first_scan_ms': cold['first_scan_ms'],
+        'second_scan_ms': cold['second_scan_ms'],
+        'warm_up_ms': warm['warm_up_ms'],
+        'first_scan_after_warm_up_ms': warm['first_scan_ms'],
+    }
+    for name, value in results.items():
+        print(f"{name:<30}{value:>10}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({'latency': args.latency, 'results': results}, f, indent=1, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print("No baseline; run with --update-baseline to record one.")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('latency') != args.latency:
+        print(f"Baseline was recorded with latency {baseline.get('latency')}; not comparing.")
+        return
+    regressions = [f"{name} {value}ms > {baseline['results'][name]}ms" for name, value in results.items()
+                   if name in baseline['results'] and value > baseline['results'][name] * (1 + args.tolerance)]
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if regressions:
+        sys.exit(1)
+    print("No regressions against the baseline.")
+
+if __name__ == "__main__":
+    main()
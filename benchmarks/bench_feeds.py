@@ -0,0 +1,60 @@
+"""
+Benchmarks scout's streaming feed parser against the original BeautifulSoup
++ dateparser code (benchmarks/legacy.py) on the recorded Yahoo RSS and
+Reddit Atom feeds in benchmarks/fixtures/feeds. Reports parse time and peak
+traced memory for a short (7 day) and a long (365 day) lookback.
+
+    python benchmarks/bench_feeds.py
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import scout
+import legacy
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "feeds")
+# The recorded feeds end on this date; lookbacks are measured from it.
+RECORDED_AT = datetime(2026, 10, 1, 16, 0, tzinfo=timezone.utc)
+
+FEEDS = [
+    ("yahoo_headline.rss", lambda c, t, d: scout._parse_feed(c, t, d, 'Yahoo/Aggregate'), legacy.parse_yahoo),
+    ("reddit_wsb_search.atom", lambda c, t, d: scout._parse_feed(c, t, d, 'Reddit/WSB'), legacy.parse_reddit),
+]
+
+def _measure(fn, content, cutoff, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        rows = fn(content, "NVDA", cutoff)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    fn(content, "NVDA", cutoff)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    legacy.dateparser.parse("Wed, 01 Oct 2026 16:00:00 +0000")  # load dateparser's language data up front
+
+    print(f"{'feed':<24}{'days':>5}{'new ms':>9}{'new KB':>9}{'items':>7}{'old ms':>9}{'old KB':>9}{'items':>7}{'speedup':>9}")
+    for name, new_fn, old_fn in FEEDS:
+        with open(os.path.join(FIXTURES, name), "rb") as f:
+            content = f.read()
+        for days in (7, 365):
+            cutoff = RECORDED_AT - timedelta(days=days)
+            new_t, new_peak, new_rows = _measure(new_fn, content, cutoff, args.repeat)
+            old_t, old_peak, old_rows = _measure(old_fn, content, cutoff, args.repeat)
+            print(f"{name:<24}{days:>5}{new_t * 1000:>9.1f}{new_peak // 1024:>9}{len(new_rows):>7}"
+                  f"{old_t * 1000:>9.1f}{old_peak // 1024:>9}{len(old_rows):>7}{old_t / new_t:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmarks scout's IR page extractor against the original dateparser sweep
+(benchmarks/legacy.py) on the saved pages in benchmarks/fixtures/ir.
+
+The corpus pages are synthetic and modelled on common IR layouts: a
+Q4-style module list, a release table, deeply nested cards with
+day-month-year dates, and a newsroom list with ISO dates.
+
+    python benchmarks/bench_ir_extract.py --repeat 3
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import scout
+import legacy
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "ir")
+CUTOFF = datetime(2000, 1, 1, tzinfo=timezone.utc)
+BASE_URL = "https://investors.example.com"
+
+def _time(fn, html, repeat):
+    best, rows = None, None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        rows = fn(html, BASE_URL, "EXMP", CUTOFF)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per page; the best run is reported.")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the new extractor.")
+    args = parser.parse_args()
+
+    pages = sorted(glob.glob(os.path.join(FIXTURES, "*.html")))
+    total_new = total_old = 0.0
+    print(f"{'page':<24}{'KB':>6}{'new ms':>10}{'items':>7}{'old ms':>10}{'items':>7}{'speedup':>9}")
+    for path in pages:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        new_t, new_rows = _time(scout._parse_ir, html, args.repeat)
+        total_new += new_t
+        line = f"{os.path.basename(path):<24}{len(html) // 1024:>6}{new_t * 1000:>10.1f}{len(new_rows):>7}"
+        if not args.skip_legacy:
+            old_t, old_rows = _time(legacy.parse_ir, html, 1)
+            total_old += old_t
+            unique_old = len({r['link'] for r in old_rows})
+            line += f"{old_t * 1000:>10.1f}{unique_old:>7}{old_t / new_t:>8.1f}x"
+        print(line)
+    print(f"\nnew: {len(pages) / total_new:.1f} docs/sec")
+    if not args.skip_legacy:
+        print(f"old: {len(pages) / total_old:.2f} docs/sec  (speedup {total_old / total_new:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmarks scout.match_keywords (one batched rapidfuzz cdist call) against
+the original Streamlit keyword loop (benchmarks/legacy.py) on synthetic
+headlines - about what a year-long lookback over a few tickers returns.
+
+    python benchmarks/bench_keywords.py
+    python benchmarks/bench_keywords.py --sizes 10000 50000 --keywords "earnings, merger, layoff"
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import scout
+import legacy
+
+WORDS = ("NVIDIA AMD Palantir reports quarterly results revenue guidance beats misses analyst upgrade "
+         "downgrade shares jump fall announces partnership acquisition merger layoffs earnings call "
+         "dividend buyback CEO steps down data center AI chip demand record outlook raises cuts").split()
+
+def make_headlines(n, seed=7):
+    rng = random.Random(seed)
+    return [{'headline': " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14)))} for _ in range(n)]
+
+def _best(fn, repeat):
+    best, rows = None, None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        rows = fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--keywords", default="earnings, merger, layoff, guidance, buyback")
+    parser.add_argument("--threshold", type=int, default=75)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'headlines':>10}{'mode':>7}{'new ms':>9}{'matches':>9}{'old ms':>9}{'matches':>9}{'speedup':>9}")
+    for n in args.sizes:
+        items = make_headlines(n)
+        old_t, old_rows = _best(lambda: legacy.filter_keywords(items, args.keywords, args.threshold), args.repeat)
+        for mode in scout.MATCH_MODES:
+            new_t, new_rows = _best(lambda: scout.match_keywords(items, args.keywords, mode, args.threshold), args.repeat)
+            if mode == 'fuzzy':
+                assert new_rows == old_rows, "fuzzy mode must match the original filter"
+            print(f"{n:>10}{mode:>7}{new_t * 1000:>9.1f}{len(new_rows):>9}"
+                  f"{old_t * 1000:>9.1f}{len(old_rows):>9}{old_t / new_t:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Scan throughput vs. parse worker processes. Runs a bench_suite scenario
+against the replay server once with parsing in threads (the default) and
+once per process-pool size, and reports tickers/s and the speedup over
+threads. With no injected latency the scan is bound by parsing, so the
+pool should scale until it runs out of cores:
+
+    python benchmarks/bench_parse_scaling.py
+    python benchmarks/bench_parse_scaling.py --scenario app.scan --tickers 100 --processes 1 2 4 8
+"""
+import argparse
+import os
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+from bench_suite import run_scenario
+from replay_server import spawn_replay_server
+
+def _default_processes():
+    counts, n = [], 1
+    while n < (os.cpu_count() or 1):
+        counts.append(n)
+        n *= 2
+    return counts + [os.cpu_count() or 1]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=('_fetch_ir', 'get_news', 'app.scan'), default='get_news')
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--processes", nargs="+", type=int, default=_default_processes())
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    proc, replay_url = spawn_replay_server(latency=args.latency)
+    print(f"{args.scenario} @ {args.tickers} tickers, {os.cpu_count()} CPUs")
+    print(f"{'parse workers':<16}{'tickers/s':>11}{'p95 ms':>9}{'RSS MB':>8}{'speedup':>9}")
+    base = None
+    try:
+        for processes in [0] + [p for p in args.processes if p > 0]:
+            os.environ["SCOUT_PARSE_PROCESSES"] = str(processes)
+            r = run_scenario(args.scenario, args.tickers, replay_url, args.rounds)
+            base = base or r['throughput']
+            label = f"{processes} processes" if processes else "threads"
+            print(f"{label:<16}{r['throughput']:>11}{r['p95_ms']:>9}{r['peak_rss_mb'] or '-':>8}"
+                  f"{r['throughput'] / base:>8.2f}x", flush=True)
+    finally:
+        os.environ.pop("SCOUT_PARSE_PROCESSES", None)
+        proc.terminate()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Offline end-to-end benchmark suite. Every scenario runs in a fresh process
+against the local replay server (benchmarks/replay_server.py), so no live
+site is touched and peak RSS is per scenario. Reports throughput (tickers/s),
+latency percentiles of the measured call and peak RSS, and compares them
+with the stored baseline:
+
+    python benchmarks/bench_suite.py                       # run + check against baseline.json
+    python benchmarks/bench_suite.py --update-baseline     # record a new baseline
+    python benchmarks/bench_suite.py --scenarios get_news --sizes 1 10 --error-rate 0.05
+
+Exits with status 1 if any scenario regressed past --tolerance (throughput
+down, p95 latency or RSS up) or returned fewer items than the baseline.
+Baselines are only comparable on the same machine and fault settings.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+SCENARIOS = ('find_ir_page', '_fetch_ir', 'get_news', 'search_edgar_filings', 'get_edgar_filings', 'app.scan')
+SIZES = (1, 10, 100)
+BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+# The fixtures were recorded on this date; the lookback reaches a year before it.
+RECORDED_AT = datetime(2026, 10, 1, tzinfo=timezone.utc)
+FAULT_OPTIONS = ('latency', 'jitter', 'error_rate', 'timeout_rate')
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+# --- child: one scenario at one size -------------------------------------
+
+def _ir_url(ticker):
+    return f"https://www.{ticker.lower()}-corp.com/investors"
+
+async def _timed(coro):
+    t0 = time.perf_counter()
+    result = await coro
+    return time.perf_counter() - t0, result
+
+def _run_concurrently(coros):
+    """Runs coroutines together on scout's engine; returns (latencies, item count)."""
+    import scout
+    async def gather():
+        return await asyncio.gather(*(_timed(c) for c in coros))
+    results = scout._run(gather())
+    return [latency for latency, _ in results], sum(len(r or ()) for _, r in results)
+
+def _scenario(name, tickers, days):
+    import scout
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    if name == 'find_ir_page':
+        latencies, _ = _run_concurrently([scout.async_find_ir_page(t, refresh=True) for t in tickers])
+        return latencies, sum(scout.get_ir_cache().get(t)[1] for t in tickers)
+    if name == '_fetch_ir':
+        return _run_concurrently([scout._afetch_ir(_ir_url(t), t, cutoff) for t in tickers])
+    if name == 'get_news':
+        return _run_concurrently([scout.async_get_news(_ir_url(t), t, days, limit=None, incremental=False)
+                                  for t in tickers])
+    if name == 'search_edgar_filings':
+        return _run_concurrently([scout.async_search_edgar_filings(t, "replay", 5) for t in tickers])
+    if name == 'get_edgar_filings':
+        return _run_concurrently([scout.async_get_edgar_filings(t, 5) for t in tickers])
+    if name == 'app.scan':
+        import app
+        logging.getLogger().setLevel(logging.WARNING)
+        t0 = time.perf_counter()
+        resp = app.app.test_client().post('/api/scan', json={'tickers': tickers, 'days': days, 'limit': 100})
+        rows = resp.get_json()
+        return [time.perf_counter() - t0], sum(1 for row in rows if 'error' not in row)
+    raise ValueError(f"unknown scenario {name!r}")
+
+def run_child(name, size, replay_url, rounds):
+    import scout
+    import store
+    from replay_server import ReplayTransport
+    logging.basicConfig(level=logging.ERROR)
+    scout.HTTP_TRANSPORT = ReplayTransport(replay_url)
+    # googlesearch talks to Google directly, outside scout's clients.
+    scout._google_ir_search = lambda ticker: None
+    days = (datetime.now(timezone.utc) - RECORDED_AT).days + 365
+    workdir = tempfile.mkdtemp(prefix="scout-bench-")
+    scout.SEC_TICKERS_PATH = os.path.join(workdir, "company_tickers.json")
+
+    def fresh_state(tag):
+        scout.response_cache.clear()
+        scout.filings_cache.clear()
+        scout._stores.clear()
+        scout._submissions.clear()
+        store.DB_PATH = os.path.join(workdir, f"{tag}.db")
+
+    fresh_state("warmup")
+    _scenario(name, ["WARM"], days)  # imports, dateparser data, connection pool
+    latencies, wall, items = [], 0.0, 0
+    for r in range(rounds):
+        fresh_state(f"round{r}")
+        tickers = [f"T{i:03d}" for i in range(size)]
+        t0 = time.perf_counter()
+        round_latencies, items = _scenario(name, tickers, days)
+        wall += time.perf_counter() - t0
+        latencies += round_latencies
+    return {
+        'scenario': name, 'tickers': size, 'calls': len(latencies), 'items': items,
+        'throughput': round(size * rounds / wall, 2),
+        'p50_ms': round(_percentile(latencies, 50) * 1000, 1),
+        'p95_ms': round(_percentile(latencies, 95) * 1000, 1),
+        'p99_ms': round(_percentile(latencies, 99) * 1000, 1),
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+# --- parent: orchestration, report, baseline -----------------------------
+
+def run_scenario(name, size, replay_url, rounds):
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", name, str(size),
+           "--replay", replay_url, "--rounds", str(rounds)]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} @ {size} failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def compare(result, base, tolerance):
+    """List of regressions of `result` against its baseline entry."""
+    problems = []
+    if result['throughput'] < base['throughput'] * (1 - tolerance):
+        problems.append(f"throughput {result['throughput']} < {base['throughput']}")
+    if result['p95_ms'] > base['p95_ms'] * (1 + tolerance):
+        problems.append(f"p95 {result['p95_ms']}ms > {base['p95_ms']}ms")
+    rss, base_rss = result['peak_rss_mb'], base.get('peak_rss_mb')
+    if rss and base_rss and rss > base_rss * (1 + tolerance):
+        problems.append(f"peak RSS {result['peak_rss_mb']}MB > {base['peak_rss_mb']}MB")
+    if result['items'] < base['items']:
+        problems.append(f"items {result['items']} < {base['items']}")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.005)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed relative regression.")
+    parser.add_argument("--child", nargs=2, metavar=("SCENARIO", "SIZE"), help=argparse.SUPPRESS)
+    parser.add_argument("--replay", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child[0], int(args.child[1]), args.replay, args.rounds)))
+        return
+
+    from replay_server import spawn_replay_server
+    faults = {name: getattr(args, name) for name in FAULT_OPTIONS}
+    proc, replay_url = spawn_replay_server(**faults)
+    results = []
+    try:
+        print(f"{'scenario':<22}{'tickers':>8}{'calls':>7}{'items':>7}{'tickers/s':>11}"
+              f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'RSS MB':>8}")
+        for name in args.scenarios:
+            for size in args.sizes:
+                r = run_scenario(name, size, replay_url, args.rounds)
+                results.append(r)
+                print(f"{r['scenario']:<22}{r['tickers']:>8}{r['calls']:>7}{r['items']:>7}{r['throughput']:>11}"
+                      f"{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}{r['peak_rss_mb'] or '-':>8}", flush=True)
+    finally:
+        proc.terminate()
+
+    if args.update_baseline:
+        baseline = {'faults': faults, 'results': {f"{r['scenario']}@{r['tickers']}": r for r in results}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                old = json.load(f)
+            if old.get('faults') == faults:
+                baseline['results'] = {**old['results'], **baseline['results']}
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=1, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print("No baseline; run with --update-baseline to record one.")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('faults') != faults:
+        print(f"Baseline was recorded with {baseline.get('faults')}; not comparing.")
+        return
+    regressions = []
+    for r in results:
+        base = baseline['results'].get(f"{r['scenario']}@{r['tickers']}")
+        if base:
+            regressions += [f"{r['scenario']}@{r['tickers']}: {p}" for p in compare(r, base, args.tolerance)]
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if regressions:
+        sys.exit(1)
+    print("No regressions against the baseline.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Frozen copies of scout's original parsing code, kept only as the baseline
+the benchmarks compare against. Do not use these in the app.
+"""
+import re
+import warnings
+from datetime import timezone
+from urllib.parse import urljoin
+
+import dateparser
+from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
+from rapidfuzz import fuzz
+
+warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+
+def parse_ir(html, url, ticker, cutoff_date):
+    """Original _fetch_ir body: dateparser on every dated element's full text."""
+    results = []
+    soup = BeautifulSoup(html, 'html.parser')
+    date_regex = re.compile(r'\d{1,2},?\s+\d{4}|\b\d{4}-\d{2}-\d{2}\b', re.I)
+    for element in soup.find_all(['div', 'p', 'li', 'span', 'td', 'a']):
+        text = element.get_text(separator=" ").strip()
+        if len(text) < 5 or not date_regex.search(text): continue
+        months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
+        if not any(m in text.lower() for m in months) and '-' not in text: continue
+        dt = dateparser.parse(text, settings={'STRICT_PARSING': False})
+        if dt:
+            if dt.tzinfo is None: dt = dt.replace(tzinfo=timezone.utc)
+            if dt >= cutoff_date:
+                link, headline = None, None
+                curr = element
+                for _ in range(6):
+                    if not curr: break
+                    a_tags = curr.find_all('a')
+                    for a in a_tags:
+                        h = a.get_text().strip()
+                        href = a.get('href', '')
+                        if href and len(h) > 12: link, headline = href, h; break
+                    if link: break
+                    curr = curr.parent
+                if link and headline:
+                    if link.startswith('/'):
+                        link = urljoin(url, link)
+                    results.append({
+                        'ticker': ticker, 'date': dt.strftime("%Y-%m-%d"),
+                        'headline': headline.replace('\n', ' ').strip()[:150],
+                        'link': link, 'source': 'Official IR'
+                    })
+    return results
+
+def parse_yahoo(content, ticker, cutoff_date):
+    """Original _fetch_yahoo body: html.parser tree plus dateparser per item."""
+    results = []
+    soup = BeautifulSoup(content, "html.parser")
+    items = soup.find_all("item")
+    for item in items:
+        title_tag = item.find('title')
+        link_tag = item.find('link')
+        date_tag = item.find('pubdate') or item.find('pubDate')
+        title = title_tag.text if title_tag else ""
+        link = link_tag.next_sibling.strip() if link_tag and not link_tag.text else (link_tag.text if link_tag else "")
+        pub_date = date_tag.text if date_tag else ""
+        if not title or not link: continue
+        dt = dateparser.parse(pub_date)
+        if not dt: continue
+        if dt.tzinfo is None: dt = dt.replace(tzinfo=timezone.utc)
+        if dt >= cutoff_date:
+            results.append({
+                'ticker': ticker, 'date': dt.strftime("%Y-%m-%d"),
+                'headline': title[:150], 'link': link, 'source': 'Yahoo/Aggregate'
+            })
+    return results
+
+def parse_reddit(content, ticker, cutoff_date):
+    """Original _fetch_reddit body."""
+    results = []
+    soup = BeautifulSoup(content, "html.parser")
+    entries = soup.find_all("entry")
+    for entry in entries:
+        title_tag = entry.find('title')
+        link_tag = entry.find('link')
+        pub_date_tag = entry.find('updated')
+        title = title_tag.text if title_tag else ""
+        link = link_tag.get('href') if link_tag else ""
+        pub_date = pub_date_tag.text if pub_date_tag else ""
+        if not link or not title: continue
+        dt = dateparser.parse(pub_date)
+        if not dt: continue
+        if dt.tzinfo is None: dt = dt.replace(tzinfo=timezone.utc)
+        if dt >= cutoff_date:
+            results.append({
+                'ticker': ticker, 'date': dt.strftime("%Y-%m-%d"),
+                'headline': title[:150], 'link': link, 'source': 'Reddit/WSB'
+            })
+    return results
+
+def filter_keywords(items, filter_keywords, match_threshold):
+    """Original streamlit_app.py keyword filter: partial_ratio per headline x keyword."""
+    keywords = [k.strip().lower() for k in filter_keywords.split(",") if k.strip()]
+    final_filtered = []
+    for item in items:
+        headline = item['headline'].lower()
+        is_match = False
+        for kw in keywords:
+            if fuzz.partial_ratio(kw, headline) >= match_threshold:
+                is_match = True
+                break
+        if is_match:
+            final_filtered.append(item)
+    return final_filtered
@@ -0,0 +1,226 @@
+"""
+Local replay server for offline benchmarks. Serves the recorded fixtures in
+benchmarks/fixtures for every host scout talks to, so whole scans run
+without touching Yahoo, Reddit, IR sites or sec-api.io:
+
+    finance.yahoo.com/quote/<T>/profile      yahoo/profile.html (site: www.<t>-corp.com)
+    feeds.finance.yahoo.com/rss/2.0/headline feeds/yahoo_headline.rss
+    www.reddit.com/r/wallstreetbets/...      feeds/reddit_wsb_search.atom
+    www.<t>-corp.com/<ir path>               ir/*.html (picked per ticker)
+    investor.<t>.com, ir.<t>.com, ...        ir/*.html
+    api.sec-api.io (POST)                    sec/filings.json, filtered and paged like sec-api
+    www.sec.gov/files/company_tickers.json   sec/company_tickers.json (real CIKs plus T000-T099)
+    data.sec.gov/submissions/CIK*.json       sec/submissions.json, sec/submissions_page.json
+
+Requests arrive as /<original host>/<path>; ReplayTransport rewrites them so
+scout.HTTP_TRANSPORT can point every client here. Latency, jitter, error
+responses and hung requests (client timeouts) can be injected:
+
+    python benchmarks/replay_server.py --latency 0.02 --jitter 0.01 --error-rate 0.05 --timeout-rate 0.01
+"""
+import argparse
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+IR_PAGES = ["q4_module_list.html", "table_releases.html", "nested_cards.html", "newsroom_iso.html"]
+
+def _fixture(*parts):
+    with open(os.path.join(FIXTURES, *parts), "rb") as f:
+        return f.read()
+
+def _render(body, ticker, cik=None):
+    body = body.replace(b"{{TICKER}}", ticker.upper().encode()).replace(b"{{ticker}}", ticker.lower().encode())
+    return body.replace(b"{{cik}}", f"{int(cik):010d}".encode()) if cik else body
+
+_cik_tickers = {}
+
+def _cik_ticker(cik):
+    """The first fixture ticker registered under `cik`."""
+    if not _cik_tickers:
+        for row in json.loads(_fixture("sec", "company_tickers.json")).values():
+            _cik_tickers.setdefault(int(row["cik_str"]), row["ticker"])
+    return _cik_tickers.get(int(cik), "")
+
+def _ir_page(ticker):
+    return "ir", IR_PAGES[zlib.crc32(ticker.lower().encode()) % len(IR_PAGES)]
+
+# (host pattern, path pattern, fixture) for GET/HEAD; the fixture is a path
+# tuple or a function of the ticker matched in the host or path.
+ROUTES = [
+    (r"finance\.yahoo\.com", r"/quote/(?P<ticker>[^/]+)/profile/?", ("yahoo", "profile.html")),
+    (r"feeds\.finance\.yahoo\.com", r"/rss/2\.0/headline", ("feeds", "yahoo_headline.rss")),
+    (r"(www\.)?reddit\.com", r"/r/wallstreetbets/search\.rss", ("feeds", "reddit_wsb_search.atom")),
+    (r"www\.(?P<ticker>[a-z0-9.-]+)-corp\.com", r"/(investors|ir|investor-relations|newsroom)/?", _ir_page),
+    (r"(investor|ir|investors)\.(?P<ticker>[a-z0-9-]+)\.com", r"/?", _ir_page),
+    (r"www\.sec\.gov", r"/files/company_tickers\.json", ("sec", "company_tickers.json")),
+    (r"data\.sec\.gov", r"/submissions/CIK(?P<cik>\d{10})\.json", ("sec", "submissions.json")),
+    (r"data\.sec\.gov", r"/submissions/CIK(?P<cik>\d{10})-submissions-\d+\.json", ("sec", "submissions_page.json")),
+]
+CONTENT_TYPES = {".html": "text/html; charset=utf-8", ".rss": "application/rss+xml",
+                 ".atom": "application/atom+xml", ".json": "application/json"}
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Set per server by start_replay_server.
+    latency = 0.0
+    jitter = 0.0
+    error_rate = 0.0
+    error_status = 503
+    timeout_rate = 0.0
+    hang = 10.0
+    rng = random.Random(0)
+
+    def _split(self):
+        host, _, rest = self.path.lstrip("/").partition("/")
+        parts = urlsplit("/" + rest)
+        return host.lower(), parts.path, parts.query
+
+    def _inject(self):
+        """Sleeps for the configured latency; returns False if the request was answered with a fault."""
+        delay = self.latency + (self.rng.uniform(-self.jitter, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+        roll = self.rng.random()
+        if roll < self.timeout_rate:
+            time.sleep(self.hang)
+            self.close_connection = True
+            return False
+        if roll < self.timeout_rate + self.error_rate:
+            self._send(self.error_status, b"replayed error", "text/plain", {"Retry-After": "1"})
+            return False
+        return True
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        host, path, query = self._split()
+        for host_re, path_re, fixture in ROUTES:
+            host_match = re.fullmatch(host_re, host)
+            path_match = host_match and re.fullmatch(path_re, path)
+            if not path_match:
+                continue
+            if not self._inject():
+                return
+            groups = {**host_match.groupdict(), **path_match.groupdict()}
+            cik = groups.get("cik")
+            ticker = (groups.get("ticker") or (cik and _cik_ticker(cik))
+                      or parse_qs(query).get("s", parse_qs(query).get("q", [""]))[0])
+            parts = fixture(ticker) if callable(fixture) else fixture
+            body = _render(_fixture(*parts), ticker, cik)
+            self._send(200, body, CONTENT_TYPES[os.path.splitext(parts[-1])[1]])
+            return
+        self._send(404, b"not recorded", "text/plain")
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        host, _, _ = self._split()
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if host != "api.sec-api.io":
+            self._send(404, b"not recorded", "text/plain")
+            return
+        if not self._inject():
+            return
+        self._send(200, json.dumps(sec_search(json.loads(body or b"{}"))).encode(), CONTENT_TYPES[".json"])
+
+    def log_message(self, *args):
+        pass
+
+def sec_search(payload):
+    """
+    Answers a sec-api.io full-text query from the filings fixture: supports
+    ticker:X, ticker:(A OR B), formType:"8-K" / formType:(...) clauses,
+    sort by filedAt and from/size paging.
+    """
+    query = payload.get("query", {}).get("query_string", {}).get("query", "")
+    def terms(field):
+        match = re.search(rf'{field}:\s*(\([^)]*\)|"[^"]*"|\S+)', query)
+        if not match:
+            return None
+        return [t.strip().strip('"') for t in match.group(1).strip("()").split(" OR ") if t.strip()]
+    tickers = terms("ticker") or []
+    forms = terms("formType")
+    template = _fixture("sec", "filings.json")
+    filings = []
+    for ticker in tickers:
+        filings += [f for f in json.loads(_render(template, ticker))["filings"]
+                    if not forms or f["formType"] in forms]
+    filings.sort(key=lambda f: f["filedAt"], reverse=True)
+    start, size = int(payload.get("from", 0)), int(payload.get("size", 50))
+    return {"total": {"value": len(filings), "relation": "eq"}, "filings": filings[start:start + size]}
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+def start_replay_server(latency=0.0, jitter=0.0, error_rate=0.0, error_status=503, timeout_rate=0.0,
+                        hang=10.0, seed=0):
+    """Starts the replay server in this process; returns (server, base_url)."""
+    settings = {"latency": latency, "jitter": jitter, "error_rate": error_rate, "error_status": error_status,
+                "timeout_rate": timeout_rate, "hang": hang, "rng": random.Random(seed)}
+    server = ReplayServer(("127.0.0.1", 0), type("Handler", (ReplayHandler,), settings))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+def spawn_replay_server(**options):
+    """Starts the replay server in a child process; returns (process, base_url)."""
+    cmd = [sys.executable, os.path.abspath(__file__)]
+    for name, value in options.items():
+        cmd += [f"--{name.replace('_', '-')}", str(value)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    return proc, proc.stdout.readline().strip()
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """httpx transport that sends every request to the replay server as /<host>/<path>."""
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+        self.inner = httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request):
+        url = request.url
+        request.url = httpx.URL(f"{self.base_url}/{url.host}{url.raw_path.decode('ascii')}")
+        request.headers["Host"] = request.url.netloc.decode("ascii")
+        return await self.inner.handle_async_request(request)
+
+    async def aclose(self):
+        await self.inner.aclose()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform +/- seconds around --latency.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with an error.")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Share of requests that hang.")
+    parser.add_argument("--hang", type=float, default=10.0, help="Seconds a hung request stalls.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    server, url = start_replay_server(**vars(args))
+    print(url, flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
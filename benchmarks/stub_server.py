@@ -0,0 +1,86 @@
+"""
+Local stub HTTP server for benchmarks. Speaks HTTP/1.1 with Content-Length so
+clients can keep connections alive, can add a fixed per-request latency, and
+can serve HTTPS with a throwaway self-signed certificate (needs `openssl`).
+
+Run it in its own process so it does not compete with the client for the GIL:
+
+    python benchmarks/stub_server.py --latency 0.02 --tls
+"""
+import argparse
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = b"<html><body><p>ok</p></body></html>"
+    latency = 0.0
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(self.body)
+
+    do_HEAD = do_GET
+
+    def log_message(self, *args):
+        pass
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+def _self_signed_context(workdir):
+    cert, key = os.path.join(workdir, "cert.pem"), os.path.join(workdir, "key.pem")
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                    "-subj", "/CN=127.0.0.1", "-keyout", key, "-out", cert],
+                   check=True, capture_output=True)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    return context
+
+def start_stub_server(latency=0.0, body=None, tls=False):
+    """Starts the stub server in this process; returns (server, base_url)."""
+    handler = type("Handler", (StubHandler,), {"latency": latency, "body": body or StubHandler.body})
+    server = StubServer(("127.0.0.1", 0), handler)
+    scheme = "http"
+    if tls:
+        with tempfile.TemporaryDirectory() as workdir:
+            server.socket = _self_signed_context(workdir).wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"{scheme}://127.0.0.1:{server.server_port}"
+
+def spawn_stub_server(latency=0.0, tls=False):
+    """Starts the stub server in a child process; returns (process, base_url)."""
+    cmd = [sys.executable, os.path.abspath(__file__), "--latency", str(latency)]
+    if tls:
+        cmd.append("--tls")
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    return proc, proc.stdout.readline().strip()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--tls", action="store_true")
+    args = parser.parse_args()
+    server, url = start_stub_server(latency=args.latency, tls=args.tls)
+    print(url, flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
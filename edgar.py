@@ -0,0 +1,153 @@
+"""
+EDGAR bulk data: the SEC's ticker -> CIK index (company_tickers.json) and
+per-registrant submissions JSON (data.sec.gov/submissions/CIK##########.json).
+Parsing only; scout does the fetching.
+"""
+import json
+from array import array
+from bisect import bisect_left
+
+ARCHIVES_URL = "https://www.sec.gov/Archives/edgar/data"
+
+def normalize_ticker(ticker):
+    """EDGAR spells share classes with a dash: BRK.B -> BRK-B."""
+    return ticker.strip().upper().replace(".", "-")
+
+class TickerIndex:
+    """
+    Compact ticker -> (CIK, company name) index: sorted ticker tuple, CIKs in
+    a parallel array and bisect lookups. Loads both company_tickers.json
+    ({"0": {"cik_str", "ticker", "title"}, ...}) and the columnar
+    company_tickers_exchange.json ({"fields": [...], "data": [[...], ...]}).
+    """
+    __slots__ = ('tickers', 'ciks', 'titles')
+
+    def __init__(self, rows):
+        rows = sorted({normalize_ticker(t): (int(c), n) for t, c, n in rows if t}.items())
+        self.tickers = tuple(t for t, _ in rows)
+        self.ciks = array('L', (c for _, (c, _) in rows))
+        self.titles = tuple(n for _, (_, n) in rows)
+
+    @classmethod
+    def from_json(cls, data):
+        if isinstance(data, (bytes, str)):
+            data = json.loads(data)
+        if 'fields' in data:
+            fields = data['fields']
+            cik, name, ticker = fields.index('cik'), fields.index('name'), fields.index('ticker')
+            return cls((row[ticker], row[cik], row[name]) for row in data['data'])
+        return cls((row['ticker'], row['cik_str'], row['title']) for row in data.values())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_json(f.read())
+
+    def _position(self, ticker):
+        ticker = normalize_ticker(ticker)
+        i = bisect_left(self.tickers, ticker)
+        return i if i < len(self.tickers) and self.tickers[i] == ticker else None
+
+    def cik(self, ticker):
+        i = self._position(ticker)
+        return None if i is None else self.ciks[i]
+
+    def title(self, ticker):
+        i = self._position(ticker)
+        return None if i is None else self.titles[i]
+
+    def __contains__(self, ticker):
+        return self._position(ticker) is not None
+
+    def __len__(self):
+        return len(self.tickers)
+
+def submissions_url(cik):
+    return f"https://data.sec.gov/submissions/CIK{int(cik):010d}.json"
+
+def _filing_link(cik, accession, document):
+    folder = f"{ARCHIVES_URL}/{int(cik)}/{accession.replace('-', '')}"
+    return f"{folder}/{document}" if document else f"{folder}/{accession}-index.htm"
+
+class Submissions:
+    """
+    One registrant's filings, newest first, in search_edgar_filings' shape
+    ({'date', 'type', 'description', 'link'}). update() takes a fresh
+    submissions JSON and only parses the filings it does not hold yet;
+    add_page() appends one of the older `filings.files` pages.
+    """
+    __slots__ = ('cik', 'name', 'website', 'investor_website', 'filings', 'accessions', 'pages', 'loaded_pages')
+
+    def __init__(self, cik):
+        self.cik = int(cik)
+        self.name = None
+        self.website = None
+        self.investor_website = None
+        self.filings = []
+        self.accessions = set()
+        self.pages = []         # names of older submission pages
+        self.loaded_pages = set()
+
+    def update(self, data):
+        """Merges a submissions JSON document; returns the number of new filings."""
+        if isinstance(data, (bytes, str)):
+            data = json.loads(data)
+        self.name = data.get('name') or self.name
+        self.website = (data.get('website') or '').strip() or None
+        self.investor_website = (data.get('investorWebsite') or '').strip() or None
+        filings = data.get('filings', {})
+        self.pages = [page['name'] for page in filings.get('files', []) if page.get('name')]
+        new = []
+        # `recent` is newest first, so parsing stops at the first filing we hold.
+        for row in self._rows(filings.get('recent', {})):
+            if row[0] in self.accessions:
+                break
+            new.append(row)
+        self._merge(new, newer=True)
+        return len(new)
+
+    def add_page(self, name, data):
+        """Merges an older submissions page (the bare columnar `recent` structure)."""
+        if isinstance(data, (bytes, str)):
+            data = json.loads(data)
+        self.loaded_pages.add(name)
+        new = [row for row in self._rows(data) if row[0] not in self.accessions]
+        self._merge(new, newer=False)
+        return len(new)
+
+    def unloaded_pages(self):
+        return [name for name in self.pages if name not in self.loaded_pages]
+
+    def _rows(self, columns):
+        accessions = columns.get('accessionNumber', [])
+        n = len(accessions)
+        def column(name):
+            values = columns.get(name) or []
+            return values if len(values) == n else [''] * n
+        for accession, date, form, document, description in zip(
+                accessions, column('filingDate'), column('form'), column('primaryDocument'),
+                column('primaryDocDescription')):
+            yield accession, {
+                'date': date,
+                'type': form or 'Unknown',
+                'description': description or f"Form {form}",
+                'link': _filing_link(self.cik, accession, document),
+            }
+
+    def _merge(self, rows, newer):
+        if not rows:
+            return
+        self.accessions.update(accession for accession, _ in rows)
+        rows = [row for _, row in rows]
+        # Stable sort: same-day filings keep their newest-first order.
+        merged = rows + self.filings if newer else self.filings + rows
+        merged.sort(key=lambda row: row['date'], reverse=True)
+        self.filings = merged
+
+    def select(self, limit=5, form_types=None):
+        """The newest `limit` filings (None for all), optionally only of `form_types`."""
+        rows = self.filings
+        if form_types:
+            forms = set(form_types)
+            rows = [row for row in rows if row['type'] in forms]
+        return rows[:limit] if limit is not None else list(rows)
@@ -0,0 +1,135 @@
+"""
+Per-stage scan instrumentation. Every timed stage (connect, transfer, parse,
+extract, ...) of every source is aggregated into process-wide Prometheus
+metrics and, while a trace is active, appended to that scan's timing records:
+
+    {'ticker', 'source', 'stage', 'seconds', 'items', 'error'}
+
+Labels (ticker, source) travel in context variables, so they follow a scan
+into its asyncio tasks and asyncio.to_thread workers.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_labels = contextvars.ContextVar('scout_labels', default=(None, None))
+_trace = contextvars.ContextVar('scout_trace', default=None)
+
+class Registry:
+    """Thread-safe stage histograms and item/error counters keyed by (source, stage)."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.histograms = {}  # (source, stage) -> [bucket counts..., count, sum]
+            self.items = {}
+            self.errors = {}      # (source, stage, error) -> count
+
+    def observe(self, source, stage, seconds, items=None, error=None):
+        key = (source or 'unknown', stage)
+        with self.lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = [0] * (len(BUCKETS) + 2)
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    hist[i] += 1
+            hist[-2] += 1
+            hist[-1] += seconds
+            if items:
+                self.items[key] = self.items.get(key, 0) + items
+            if error:
+                self.errors[key + (error,)] = self.errors.get(key + (error,), 0) + 1
+
+    def render(self, extra=None):
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self.lock:
+            histograms = {k: list(v) for k, v in self.histograms.items()}
+            items, errors = dict(self.items), dict(self.errors)
+        lines = [
+            "# HELP scout_stage_seconds Time spent per scan stage.",
+            "# TYPE scout_stage_seconds histogram",
+        ]
+        for (source, stage), hist in sorted(histograms.items()):
+            labels = f'source="{_escape(source)}",stage="{stage}"'
+            for bound, count in zip(BUCKETS, hist):
+                lines.append(f'scout_stage_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'scout_stage_seconds_bucket{{{labels},le="+Inf"}} {hist[-2]}')
+            lines.append(f'scout_stage_seconds_count{{{labels}}} {hist[-2]}')
+            lines.append(f'scout_stage_seconds_sum{{{labels}}} {hist[-1]:.6f}')
+        lines += ["# HELP scout_stage_items_total Items produced per scan stage.",
+                  "# TYPE scout_stage_items_total counter"]
+        for (source, stage), count in sorted(items.items()):
+            lines.append(f'scout_stage_items_total{{source="{_escape(source)}",stage="{stage}"}} {count}')
+        lines += ["# HELP scout_stage_errors_total Failed scan stages by error class.",
+                  "# TYPE scout_stage_errors_total counter"]
+        for (source, stage, error), count in sorted(errors.items()):
+            lines.append(f'scout_stage_errors_total{{source="{_escape(source)}",stage="{stage}",'
+                         f'error="{_escape(error)}"}} {count}')
+        for name, (kind, help_text, value) in sorted((extra or {}).items()):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+registry = Registry()
+
+def error_class(exc):
+    """Short error label: the exception class, plus the status for HTTP errors."""
+    status = getattr(exc, 'status', None)
+    return f"{type(exc).__name__}:{status}" if status else type(exc).__name__
+
+@contextmanager
+def labels(ticker=None, source=None):
+    """Sets the ticker/source that stages recorded inside the block belong to."""
+    current = _labels.get()
+    token = _labels.set((ticker or current[0], source or current[1]))
+    try:
+        yield
+    finally:
+        _labels.reset(token)
+
+def record(stage, seconds, items=None, error=None):
+    ticker, source = _labels.get()
+    registry.observe(source, stage, seconds, items, error)
+    trace = _trace.get()
+    if trace is not None:
+        trace.append({'ticker': ticker, 'source': source, 'stage': stage,
+                      'seconds': round(seconds, 4), 'items': items, 'error': error})
+
+class _Stage:
+    __slots__ = ('items',)
+
+    def __init__(self):
+        self.items = None
+
+@contextmanager
+def stage(name):
+    """
+    Times a block as stage `name` of the current source. Set `.items` on the
+    yielded object to record an item count; exceptions are recorded with
+    their error class and re-raised.
+    """
+    timed = _Stage()
+    started = time.perf_counter()
+    try:
+        yield timed
+    except BaseException as e:
+        record(name, time.perf_counter() - started, timed.items, error_class(e))
+        raise
+    record(name, time.perf_counter() - started, timed.items)
+
+def start_trace():
+    """Starts collecting timing records for the current task; returns the list they go to."""
+    records = []
+    _trace.set(records)
+    return records
+
+def render(extra=None):
+    return registry.render(extra)
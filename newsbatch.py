@@ -0,0 +1,150 @@
+"""
+Column-backed news results. A NewsBatch holds the same fields as scout's
+news item dicts ({'ticker', 'date', 'headline', 'link', 'source'}) as
+columns: dates as datetime64 (UTC midnight of the item's day), ticker and
+source as categorical codes, headlines and links as object arrays. Large
+multi-ticker scans take a fraction of the memory of the dicts and convert
+to pandas or Arrow without copying the date and code columns.
+"""
+import io
+
+import numpy as np
+
+FIELDS = ('ticker', 'date', 'headline', 'link', 'source')
+DATE_UNIT = 'datetime64[s]'
+
+def _codes(values, categories=()):
+    """(codes, categories) for a sequence of labels; known `categories` keep their order."""
+    index = {c: i for i, c in enumerate(categories)}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.int32, count=len(values))
+    return codes, tuple(index)
+
+def _object_array(values):
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+class NewsBatch:
+    """News items as columns. Iterating yields the item dicts, so it can stand in for a list of items."""
+    __slots__ = ('tickers', 'ticker_codes', 'sources', 'source_codes', 'dates', 'headlines', 'links')
+
+    def __init__(self, tickers, ticker_codes, sources, source_codes, dates, headlines, links):
+        self.tickers = tuple(tickers)
+        self.ticker_codes = ticker_codes
+        self.sources = tuple(sources)
+        self.source_codes = source_codes
+        self.dates = dates
+        self.headlines = headlines
+        self.links = links
+
+    @classmethod
+    def from_rows(cls, rows, sources=()):
+        """Builds a batch from (ticker, date, headline, link, source) tuples, dates as YYYY-MM-DD."""
+        columns = list(zip(*rows)) or [()] * len(FIELDS)
+        ticker, date, headline, link, source = columns
+        ticker_codes, tickers = _codes(ticker)
+        source_codes, sources = _codes(source, sources)
+        return cls(tickers, ticker_codes, sources, source_codes,
+                   np.array(date, dtype='datetime64[D]').astype(DATE_UNIT),
+                   _object_array(headline), _object_array(link))
+
+    @classmethod
+    def from_items(cls, items, sources=()):
+        """Builds a batch from news item dicts; `sources` fixes the order of the source categories."""
+        return cls.from_rows([tuple(item[f] for f in FIELDS) for item in items], sources)
+
+    @classmethod
+    def concat(cls, batches):
+        batches = [b for b in batches if len(b)]
+        if not batches:
+            return cls.from_rows([])
+        tickers, sources = {}, {}
+        ticker_codes, source_codes = [], []
+        for b in batches:
+            # Re-map each batch's codes onto the merged categories.
+            ticker_map = np.array([tickers.setdefault(t, len(tickers)) for t in b.tickers], dtype=np.int32)
+            source_map = np.array([sources.setdefault(s, len(sources)) for s in b.sources], dtype=np.int32)
+            ticker_codes.append(ticker_map[b.ticker_codes])
+            source_codes.append(source_map[b.source_codes])
+        return cls(tickers, np.concatenate(ticker_codes), sources, np.concatenate(source_codes),
+                   np.concatenate([b.dates for b in batches]),
+                   np.concatenate([b.headlines for b in batches]),
+                   np.concatenate([b.links for b in batches]))
+
+    def __len__(self):
+        return len(self.dates)
+
+    def row(self, i):
+        return {
+            'ticker': self.tickers[self.ticker_codes[i]],
+            'date': str(self.dates[i].astype('datetime64[D]')),
+            'headline': self.headlines[i],
+            'link': self.links[i],
+            'source': self.sources[self.source_codes[i]],
+        }
+
+    def __iter__(self):
+        return (self.row(i) for i in range(len(self)))
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.row(index)
+        return self.take(index)
+
+    def to_items(self):
+        return list(self)
+
+    def take(self, index):
+        """A new batch of the rows selected by a slice, index array or boolean mask."""
+        return NewsBatch(self.tickers, self.ticker_codes[index], self.sources, self.source_codes[index],
+                         self.dates[index], self.headlines[index], self.links[index])
+
+    def newest_first(self):
+        """Sorted by date, newest first; same-day items keep their order."""
+        return self.take(np.argsort(-self.dates.view(np.int64), kind='stable'))
+
+    def where(self, tickers=None, sources=None, since=None):
+        """Rows of the given tickers/sources dated on or after `since` (YYYY-MM-DD)."""
+        mask = np.ones(len(self), dtype=bool)
+        if tickers is not None:
+            wanted = set(tickers)
+            mask &= np.isin(self.ticker_codes, [i for i, t in enumerate(self.tickers) if t in wanted])
+        if sources is not None:
+            wanted = set(sources)
+            mask &= np.isin(self.source_codes, [i for i, s in enumerate(self.sources) if s in wanted])
+        if since is not None:
+            mask &= self.dates >= np.datetime64(since, 's')
+        return self.take(mask)
+
+    def to_pandas(self):
+        """DataFrame with categorical ticker/source and datetime64 date columns."""
+        import pandas as pd
+        return pd.DataFrame({
+            'ticker': pd.Categorical.from_codes(self.ticker_codes, categories=list(self.tickers), validate=False),
+            'date': self.dates,
+            'headline': self.headlines,
+            'link': self.links,
+            'source': pd.Categorical.from_codes(self.source_codes, categories=list(self.sources), validate=False),
+        }, copy=False)
+
+    def to_arrow(self):
+        """pyarrow Table with dictionary-encoded ticker/source and timestamp dates. Needs pyarrow."""
+        import pyarrow as pa
+        return pa.table({
+            'ticker': pa.DictionaryArray.from_arrays(self.ticker_codes, list(self.tickers)),
+            'date': pa.array(self.dates),
+            'headline': pa.array(self.headlines, type=pa.string()),
+            'link': pa.array(self.links, type=pa.string()),
+            'source': pa.DictionaryArray.from_arrays(self.source_codes, list(self.sources)),
+        })
+
+    def to_csv(self):
+        """CSV text with dates as YYYY-MM-DD."""
+        return self.to_pandas().to_csv(index=False, date_format='%Y-%m-%d')
+
+    def to_parquet(self):
+        """Parquet file contents as bytes. Needs pyarrow."""
+        import pyarrow.parquet as pq
+        buffer = io.BytesIO()
+        pq.write_table(self.to_arrow(), buffer)
+        return buffer.getvalue()
@@ -0,0 +1,203 @@
+"""
+Background watchlist poller. Keeps the news store fresh so /api/scan and the
+Streamlit app can answer from disk instead of scraping inline.
+
+Each source has its own polling interval and token-bucket rate limit, and
+backs off with jitter when it answers 429 or 5xx (honouring Retry-After).
+Polled results are marked fresh for about one interval, so scans serve them
+from the store until the next poll is due.
+
+    python poller.py NVDA AMD PLTR
+    python poller.py --watchlist watchlist.txt --days 30 --sec-key $SEC_API_KEY
+    python poller.py --config poller.json --once
+"""
+import argparse
+import asyncio
+import heapq
+import json
+import logging
+import os
+import random
+import time
+
+import scout
+
+logger = logging.getLogger("Poller")
+
+# Per-source schedule: seconds between polls of one ticker, token-bucket
+# refill rate (polls/second across all tickers), burst size, and how many
+# tickers one poll (one token) covers. SEC tickers are polled in groups that
+# scout sends as a single sec-api query.
+SOURCE_SCHEDULE = {
+    'Yahoo/Aggregate': {'interval': 300, 'rate': 1.0, 'burst': 5},
+    'Reddit/WSB': {'interval': 600, 'rate': 0.2, 'burst': 2},
+    'Official IR': {'interval': 1800, 'rate': 1.0, 'burst': 4},
+    scout.SEC_SOURCE: {'interval': 900, 'rate': 0.1, 'burst': 1, 'batch': scout.SEC_BATCH_SIZE},
+}
+
+BACKOFF_BASE = 30
+BACKOFF_MAX = 3600
+# Polled results count as fresh for this many intervals: the next poll comes
+# after 0.9-1.1 intervals plus any rate-limit wait.
+FRESH_INTERVALS = 1.5
+
+class SourceState:
+    """Schedule, rate limit and backoff state shared by every ticker of one source."""
+    def __init__(self, name, interval, rate, burst, batch=1):
+        self.name = name
+        self.interval = interval
+        self.bucket = scout.TokenBucket(rate, burst)
+        self.batch = max(1, int(batch))
+        self.failures = 0
+        self.paused_until = 0.0
+
+    def backoff(self, retry_after=None):
+        """Pauses the whole source after a 429/5xx; returns the delay in seconds."""
+        self.failures += 1
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self.failures - 1)) * random.uniform(0.5, 1.5)
+        if retry_after:
+            delay = max(delay, retry_after)
+        self.paused_until = time.monotonic() + delay
+        return delay
+
+class Poller:
+    """
+    Polls every (ticker, source) pair of a watchlist on its source's interval.
+    Jobs (one ticker, or a group for batched sources) are kept in a heap
+    ordered by due time; at most `concurrency` run at once on scout's shared
+    HTTP engine. A job waits for its rate-limit token before it takes a slot.
+    """
+    def __init__(self, tickers, days_lookback=7, api_key=None, schedule=None, concurrency=8):
+        self.tickers = list(dict.fromkeys(t.strip().upper() for t in tickers if t.strip()))
+        self.days_lookback = days_lookback
+        self.api_key = api_key
+        schedule = {name: {**SOURCE_SCHEDULE.get(name, {}), **cfg}
+                    for name, cfg in {**SOURCE_SCHEDULE, **(schedule or {})}.items()}
+        if not api_key:
+            schedule.pop(scout.SEC_SOURCE, None)
+        self.sources = {name: SourceState(name, **cfg) for name, cfg in schedule.items()}
+        self.concurrency = concurrency
+        self.slots = asyncio.Semaphore(concurrency)
+
+    async def poll_once(self, tickers, source):
+        """
+        Polls one source for a ticker or a tuple of tickers, on one rate-limit
+        token; returns seconds until it should run again.
+        """
+        tickers = (tickers,) if isinstance(tickers, str) else tuple(tickers)
+        state = self.sources[source]
+        wait = state.paused_until - time.monotonic()
+        if wait > 0:
+            return wait
+        # Token first: a source waiting on its rate limit must not hold slots the other sources could use.
+        await state.bucket.acquire()
+        fresh_for = state.interval * FRESH_INTERVALS
+        async with self.slots:
+            # A group's lookups start together, so scout batches them into one query.
+            outcomes = await asyncio.gather(
+                *(scout.async_poll_source(source, ticker, self.days_lookback, self.api_key, fresh_for=fresh_for)
+                  for ticker in tickers), return_exceptions=True)
+        delays = []
+        for ticker, outcome in zip(tickers, outcomes):
+            delays.append(self._settle(state, ticker, outcome))
+            if state.paused_until > time.monotonic():
+                # The whole source is backing off; one 429 per group is enough.
+                return delays[-1]
+        return min(delays)
+
+    def _settle(self, state, ticker, outcome):
+        """Seconds until a pair should run again, given its poll's item count or exception."""
+        source = state.name
+        if isinstance(outcome, scout.CircuitOpenError):
+            # The host is being fast-failed already; try the pair again once it may answer.
+            logger.warning(f"{source} skipped for {ticker}: {outcome}")
+            return outcome.retry_after
+        if isinstance(outcome, scout.SourceError):
+            if outcome.status == 429 or outcome.status >= 500:
+                delay = state.backoff(outcome.retry_after)
+                logger.warning(f"{source} answered {outcome.status} for {ticker}; pausing source for {delay:.0f}s")
+                return delay
+            logger.warning(f"{source} failed for {ticker}: {outcome}")
+            return state.interval
+        if isinstance(outcome, Exception):
+            # Network errors back off the pair, not the whole source.
+            delay = BACKOFF_BASE * random.uniform(0.5, 1.5)
+            logger.warning(f"{source} failed for {ticker}: {outcome!r}; retrying in {delay:.0f}s")
+            return delay
+        if isinstance(outcome, BaseException):
+            raise outcome
+        state.failures = 0
+        logger.info(f"{ticker} {source}: {outcome} items")
+        return state.interval * random.uniform(0.9, 1.1)
+
+    def _jobs(self):
+        """(tickers, source) per poll job: one ticker each, or groups of `batch` tickers."""
+        return [(tuple(self.tickers[i:i + state.batch]), source)
+                for source, state in self.sources.items()
+                for i in range(0, len(self.tickers), state.batch)]
+
+    async def run(self, once=False):
+        logger.info(f"Polling {len(self.tickers)} tickers across {len(self.sources)} sources")
+        if once:
+            await asyncio.gather(*(self.poll_once(tickers, source) for tickers, source in self._jobs()))
+            return
+
+        # Spread the first round over a few seconds instead of a burst.
+        now = time.monotonic()
+        jobs = [(now + random.uniform(0, 5), tickers, source) for tickers, source in self._jobs()]
+        heapq.heapify(jobs)
+        wake = asyncio.Event()
+
+        async def run_and_reschedule(tickers, source):
+            delay = await self.poll_once(tickers, source)
+            heapq.heappush(jobs, (time.monotonic() + delay, tickers, source))
+            wake.set()
+
+        running = set()
+        while True:
+            wait = jobs[0][0] - time.monotonic() if jobs else None
+            if wait is not None and wait <= 0:
+                _, tickers, source = heapq.heappop(jobs)
+                task = asyncio.ensure_future(run_and_reschedule(tickers, source))
+                running.add(task)
+                task.add_done_callback(running.discard)
+                continue
+            wake.clear()
+            try:
+                await asyncio.wait_for(wake.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+def _load_tickers(args, config):
+    tickers = list(args.tickers) + list(config.get('watchlist', []))
+    if args.watchlist:
+        with open(args.watchlist) as f:
+            tickers += [t for line in f for t in line.replace(",", " ").split()]
+    return tickers
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("tickers", nargs="*")
+    parser.add_argument("--watchlist", help="File with tickers (one per line or comma separated).")
+    parser.add_argument("--config", help="JSON file with 'watchlist' and per-source 'sources' overrides.")
+    parser.add_argument("--days", type=int, default=7, help="Lookback window kept fresh in the store.")
+    parser.add_argument("--sec-key", default=os.environ.get("SEC_API_KEY"), help="sec-api.io key (or $SEC_API_KEY).")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--once", action="store_true", help="Poll every pair once and exit.")
+    args = parser.parse_args(argv)
+
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+    tickers = _load_tickers(args, config)
+    if not tickers:
+        parser.error("no tickers given")
+    poller = Poller(tickers, args.days, args.sec_key, config.get('sources'), args.concurrency)
+    try:
+        scout._run(poller.run(once=args.once))
+    except KeyboardInterrupt:
+        logger.info("Poller stopped")
+
+if __name__ == "__main__":
+    main()
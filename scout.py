@@ -1,252 +1,2054 @@
-
-import requests
-from bs4 import BeautifulSoup
-from googlesearch import search
-import dateparser
+import asyncio
+import concurrent.futures
+import contextvars
+import httpx
 import re
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from xml.etree import ElementTree
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from urllib.parse import parse_qsl, unquote, urlencode, urljoin, urlparse
+import zlib
+from concurrent.futures import as_completed
+import numpy as np
+from rapidfuzz import fuzz, process
+import edgar
+import metrics
+import store
+from newsbatch import NewsBatch
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("IRScraper")
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Scan limits: how many requests may be in flight overall, and against a
+# single host at once.
+MAX_WORKERS = 16
+PER_HOST_LIMIT = 4
+
+# IR candidate probes: per-probe timeout, and how long a successful probe
+# waits for higher-priority candidates before winning.
+PROBE_TIMEOUT = 3
+PROBE_GRACE = 0.25
+# A failed IR discovery is cached for a day only if every lookup answered;
+# if one errored (outage, open circuit), the fallback is retried this soon.
+IR_RETRY_TTL = 900
+# Seconds IR discovery waits for EDGAR's website fields once Yahoo's profile
+# has answered with a site.
+EDGAR_GRACE = 0.5
+
+# Response cache for GETs: bodies are reused without touching the network for
+# CACHE_FRESH_SECONDS, then revalidated with ETag/Last-Modified. Total cached
+# body size is capped at CACHE_MAX_BYTES (least recently used goes first).
+CACHE_FRESH_SECONDS = 60
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+class ResponseCache:
+    """
+    Thread-safe, size-bounded LRU of GET responses keyed by URL, storing the
+    body with its ETag/Last-Modified validators. Counts fresh hits, 304
+    revalidations, misses, evictions and the body bytes not re-downloaded.
+    """
+    def __init__(self, max_bytes=CACHE_MAX_BYTES, fresh_for=CACHE_FRESH_SECONDS):
+        self.max_bytes = max_bytes
+        self.fresh_for = fresh_for
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.size = 0
+        self.counters = {'hits': 0, 'revalidated': 0, 'misses': 0, 'evictions': 0, 'bytes_saved': 0}
+
+    def lookup(self, url):
+        """Returns (entry, fresh) for a cached URL, or (None, False)."""
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is None:
+                return None, False
+            self.entries.move_to_end(url)
+            return entry, time.monotonic() - entry['stored_at'] < self.fresh_for
+
+    def validators(self, entry):
+        headers = {}
+        if entry['etag']: headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']: headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, response):
+        if 'no-store' in response.headers.get('cache-control', ''):
+            return
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+        entry = {
+            'body': body, 'stored_at': time.monotonic(),
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'content_type': response.headers.get('content-type', ''),
+        }
+        with self.lock:
+            old = self.entries.pop(url, None)
+            if old: self.size -= len(old['body'])
+            self.entries[url] = entry
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted['body'])
+                self.counters['evictions'] += 1
+
+    def record(self, outcome, entry=None):
+        with self.lock:
+            self.counters[outcome] += 1
+            if entry is not None:
+                self.counters['bytes_saved'] += len(entry['body'])
+                if outcome == 'revalidated':
+                    entry['stored_at'] = time.monotonic()
+
+    def response(self, url, entry):
+        headers = {'content-type': entry['content_type']} if entry['content_type'] else {}
+        return httpx.Response(200, content=entry['body'], headers=headers, request=httpx.Request("GET", url))
+
+    def stats(self):
+        with self.lock:
+            return dict(self.counters, entries=len(self.entries), bytes=self.size)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+response_cache = ResponseCache()
+
+def cache_stats():
+    """Hit/miss/bytes-saved counters of the shared response cache."""
+    return response_cache.stats()
+
+# Per-host health. Timeouts shrink to what each host actually needs (never
+# beyond the caller's), a circuit breaker fast-fails hosts that keep failing
+# and lets one trial request through after a cooldown (half-open), and GETs
+# still running past the host's usual latency can be hedged with a second copy.
+HOST_LATENCY_SAMPLES = 64   # recent response times kept per host
+ADAPTIVE_MIN_SAMPLES = 8    # until then the caller's timeout is used as is
+ADAPTIVE_TIMEOUT_PCT = 99
+ADAPTIVE_TIMEOUT_FACTOR = 3
+ADAPTIVE_TIMEOUT_MIN = 1.0
+BREAKER_FAILURES = 5        # consecutive failures (errors, timeouts, 429/5xx) that open a host's circuit
+BREAKER_COOLDOWN = 30       # seconds an open circuit fast-fails before a trial request
+HANG_SECONDS = 5            # without latency history, a request cancelled after this long unanswered counts as a failure
+HEDGE_REQUESTS = os.environ.get("SCOUT_HEDGE_REQUESTS", "") == "1"
+HEDGE_PCT = 95              # a GET still running past this latency percentile gets a second copy
+
+# Request rate limits (requests/second, burst) for hosts that publish one,
+# keyed by domain and shared by its subdomains. The SEC's fair-access policy
+# allows 10 requests/second across sec.gov; a burst of 1 at 9/s stays under it
+# in every one-second window.
+HOST_RATE_LIMITS = {'sec.gov': (9, 1)}
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `burst`."""
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class CircuitOpenError(Exception):
+    """A host failed BREAKER_FAILURES times in a row and is not being contacted; retry after `retry_after` s."""
+    def __init__(self, host, retry_after):
+        super().__init__(f"{host} is failing, not contacted for {retry_after:.0f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+class HostHealth:
+    """Latency window and circuit breaker of one host. Only touched on the engine loop."""
+    __slots__ = ('host', 'latencies', 'failures', 'opened_at', 'trial')
+
+    def __init__(self, host):
+        self.host = host
+        self.latencies = deque(maxlen=HOST_LATENCY_SAMPLES)
+        self.failures = 0
+        self.opened_at = None  # monotonic time the circuit opened; None while closed
+        self.trial = False     # a half-open trial request is in flight
+
+    def percentile(self, pct):
+        if len(self.latencies) < ADAPTIVE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+    def timeout(self, default):
+        observed = self.percentile(ADAPTIVE_TIMEOUT_PCT)
+        if observed is None:
+            return default
+        adaptive = max(ADAPTIVE_TIMEOUT_MIN, observed * ADAPTIVE_TIMEOUT_FACTOR)
+        return adaptive if default is None else min(default, adaptive)
+
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        return 'half-open' if self.trial or time.monotonic() - self.opened_at >= BREAKER_COOLDOWN else 'open'
+
+    def admit(self):
+        """Raises CircuitOpenError unless a request may go out; claims the half-open trial."""
+        if self.opened_at is None:
+            return
+        wait = self.opened_at + BREAKER_COOLDOWN - time.monotonic()
+        if wait > 0 or self.trial:
+            raise CircuitOpenError(self.host, max(wait, 1.0))
+        self.trial = True
+
+    def success(self, seconds):
+        self.latencies.append(seconds)
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+
+    def failure(self):
+        self.failures += 1
+        # A failed trial re-opens the circuit for another cooldown.
+        if self.trial or self.failures >= BREAKER_FAILURES:
+            if self.opened_at is None:
+                logger.warning(f"{self.host} failed {self.failures} times in a row; fast-failing it for {BREAKER_COOLDOWN}s")
+            self.opened_at = time.monotonic()
+        self.trial = False
+
+    def abandon(self):
+        """A request was cancelled before it said anything about the host."""
+        self.trial = False
+
+    def cancelled(self, seconds):
+        """
+        A request was cancelled (a deadline, a lost probe race) `seconds` after
+        it was sent. Past the host's adaptive timeout (HANG_SECONDS without
+        history) the host is hanging and it counts as a failure; earlier it
+        says nothing about the host.
+        """
+        if seconds >= (self.timeout(None) or HANG_SECONDS):
+            self.failure()
+        else:
+            self.abandon()
+
+_hedges = {'sent': 0, 'won': 0}
+
+def host_stats():
+    """{host: {'state', 'failures', 'samples', 'p50', 'p95', 'timeout'}} for every host contacted so far."""
+    async def snapshot():
+        return {host: {'state': h.state(), 'failures': h.failures, 'samples': len(h.latencies),
+                       'p50': h.percentile(50), 'p95': h.percentile(95), 'timeout': h.timeout(None)}
+                for host, h in _get_engine().hosts.items()}
+    return _run(snapshot())
+
+# Optional httpx transport used by every engine client instead of the
+# network; the benchmark suite routes scans to a local replay server with it.
+HTTP_TRANSPORT = None
+
+class _Engine:
+    """
+    Shared HTTP engine: one background event loop and pooled keep-alive
+    clients (one verifying TLS, one not, for IR sites with broken certs).
+    Every fetch in scout runs here, whether it was called sync or async.
+    """
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="scout-http", daemon=True)
+        self.thread.start()
+        self.clients = {}
+        self.host_slots = {}
+        self.hosts = {}
+        self.buckets = {}
+        self.slots = asyncio.Semaphore(MAX_WORKERS)
+
+    def client(self, verify=True):
+        client = self.clients.get(verify)
+        if client is None:
+            client = self.clients[verify] = httpx.AsyncClient(
+                verify=verify, follow_redirects=True, transport=HTTP_TRANSPORT,
+                limits=httpx.Limits(max_connections=MAX_WORKERS * 4, max_keepalive_connections=MAX_WORKERS * 2)
+            )
+        return client
+
+    def host_slot(self, url):
+        host = urlparse(url).hostname or ""
+        slot = self.host_slots.get(host)
+        if slot is None:
+            slot = self.host_slots[host] = asyncio.Semaphore(PER_HOST_LIMIT)
+        return slot
 
-def find_ir_page(ticker):
+    def host_health(self, url):
+        host = urlparse(url).hostname or ""
+        health = self.hosts.get(host)
+        if health is None:
+            health = self.hosts[host] = HostHealth(host)
+        return health
+
+    def host_rate(self, url):
+        """The token bucket limiting requests to the url's host, or None if it has no published limit."""
+        host = urlparse(url).hostname or ""
+        for domain, (rate, burst) in HOST_RATE_LIMITS.items():
+            if host == domain or host.endswith("." + domain):
+                bucket = self.buckets.get(domain)
+                if bucket is None:
+                    bucket = self.buckets[domain] = TokenBucket(rate, burst)
+                return bucket
+        return None
+
+_engine = None
+_engine_lock = threading.Lock()
+
+def _get_engine():
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _Engine()
+    return _engine
+
+def _submit(coro):
+    """Schedules a coroutine on the shared engine and returns a concurrent Future."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_engine().loop)
+
+def _run(coro):
+    """Runs a coroutine on the shared engine and blocks for its result."""
+    return _submit(coro).result()
+
+# Set while profile_scan has a profiler attached to the engine loop.
+_profiling = contextvars.ContextVar('scout_profiling', default=False)
+
+async def _in_thread(fn, *args):
+    """Runs CPU-bound parsing off the loop, or inline while profiling so it shows up."""
+    if _profiling.get():
+        return fn(*args)
+    return await asyncio.to_thread(fn, *args)
+
+# News parsing (tree building, date parsing, extraction) is pure-Python CPU
+# work that serializes on the GIL in threads. With PARSE_PROCESSES > 0 it
+# runs on a process pool instead: workers get the raw response bytes and
+# send back rows as plain tuples plus their stage timings. 0 keeps threads.
+PARSE_PROCESSES = int(os.environ.get("SCOUT_PARSE_PROCESSES", "0"))
+_ROW_FIELDS = ('ticker', 'date', 'headline', 'link', 'source')
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def set_parse_processes(processes):
+    """Sets the number of parse worker processes (0 parses in threads) and restarts the pool."""
+    global PARSE_PROCESSES, _parse_pool
+    with _parse_pool_lock:
+        PARSE_PROCESSES, pool, _parse_pool = max(0, int(processes)), _parse_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def _get_parse_pool():
+    global _parse_pool
+    if _parse_pool is None:
+        with _parse_pool_lock:
+            # Never from inside a parse worker: each would start a pool of its own.
+            if _parse_pool is None and PARSE_PROCESSES > 0 and multiprocessing.parent_process() is None:
+                # spawn, not fork: the engine thread and its sockets must not be copied.
+                _parse_pool = concurrent.futures.ProcessPoolExecutor(
+                    PARSE_PROCESSES, mp_context=multiprocessing.get_context('spawn'))
+                for _ in range(PARSE_PROCESSES):
+                    _parse_pool.submit(_warm_parse_worker)
+    return _parse_pool
+
+def _warm_parse_worker():
+    """Starts a worker (importing scout and its parsers) before the first page arrives."""
+    _warm_parsers()
+    return os.getpid()
+
+def _parse_worker(fn, args):
+    """Pool side of _in_parser: runs `fn` in a fresh context and compacts its rows."""
+    def run():
+        trace = metrics.start_trace()
+        rows = fn(*args)
+        return ([tuple(row[f] for f in _ROW_FIELDS) for row in rows],
+                [(r['stage'], r['seconds'], r['items'], r['error']) for r in trace])
+    return contextvars.Context().run(run)
+
+async def _in_parser(fn, *args):
+    """
+    Runs a news parser (returning rows with _ROW_FIELDS) on the parse pool,
+    or in a thread when there is none. Stage timings recorded in the worker
+    are replayed under the caller's labels.
+    """
+    pool = None if _profiling.get() else _get_parse_pool()
+    if pool is None:
+        return await _in_thread(fn, *args)
+    try:
+        rows, stages = await asyncio.get_running_loop().run_in_executor(pool, _parse_worker, fn, args)
+    except concurrent.futures.BrokenExecutor as e:
+        logger.error(f"Parse pool failed ({e}); parsing in threads")
+        set_parse_processes(0)
+        return await _in_thread(fn, *args)
+    for stage in stages:
+        metrics.record(*stage)
+    return [dict(zip(_ROW_FIELDS, row)) for row in rows]
+
+async def _arequest(method, url, verify=True, cache=True, **kwargs):
+    engine = _get_engine()
+    cache = response_cache if cache and method == "GET" else None
+    entry = None
+    if cache:
+        entry, fresh = cache.lookup(url)
+        if fresh:
+            cache.record('hits', entry)
+            return cache.response(url, entry)
+        if entry:
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), **cache.validators(entry)}
+    health = engine.host_health(url)
+    try:
+        health.admit()
+    except CircuitOpenError:
+        if entry:
+            # Better a stale copy than nothing while the host is down.
+            return cache.response(url, entry)
+        raise
+    queued = time.perf_counter()
+    bucket = engine.host_rate(url)
+    try:
+        # Rate-limit token, then the host slot, then a global slot: requests
+        # waiting on one slow or rate-limited host must not hold slots that
+        # requests to other hosts could use.
+        if bucket: await bucket.acquire()
+        async with engine.host_slot(url), engine.slots:
+            metrics.record('queue', time.perf_counter() - queued)
+            resp = await _asend(engine.client(verify), health, method, url, **kwargs)
+    except asyncio.CancelledError:
+        health.abandon()
+        raise
+    if cache:
+        if entry and resp.status_code == 304:
+            cache.record('revalidated', entry)
+            return cache.response(url, entry)
+        cache.record('misses')
+        if resp.status_code == 200:
+            cache.store(url, resp)
+    return resp
+
+async def _asend(client, health, method, url, **kwargs):
+    """
+    Sends one request with the host's adaptive timeout (hedged if enabled and
+    the host has enough history) and records the outcome in its health.
+    """
+    if isinstance(kwargs.get('timeout'), (int, float)):
+        kwargs['timeout'] = health.timeout(kwargs['timeout'])
+    hedge_after = health.percentile(HEDGE_PCT) if HEDGE_REQUESTS and method in ("GET", "HEAD") else None
+    started = time.perf_counter()
+    try:
+        if hedge_after:
+            resp = await _ahedged(client, method, url, hedge_after, **kwargs)
+        else:
+            resp = await _atimed_request(client, method, url, **kwargs)
+    except asyncio.CancelledError:
+        health.cancelled(time.perf_counter() - started)
+        raise
+    except Exception:
+        health.failure()
+        raise
+    if resp.status_code == 429 or resp.status_code >= 500:
+        health.failure()
+    else:
+        health.success(time.perf_counter() - started)
+    return resp
+
+async def _ahedged(client, method, url, delay, **kwargs):
+    """Sends a second copy of a request still unanswered after `delay` seconds; the first answer wins."""
+    first = asyncio.ensure_future(_atimed_request(client, method, url, **kwargs))
+    tasks = {first}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            _hedges['sent'] += 1
+            tasks.add(asyncio.ensure_future(_atimed_request(client, method, url, **kwargs)))
+        while True:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                tasks.discard(task)
+                if task.exception() is None:
+                    if task is not first: _hedges['won'] += 1
+                    return task.result()
+            if not tasks:
+                # Both copies failed: report the original's error.
+                return first.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def _atimed_request(client, method, url, **kwargs):
+    """Sends a request, recording DNS+TCP+TLS setup as 'connect' and the rest as 'transfer'."""
+    started, connect = {}, [0.0]
+
+    async def trace(event, info):
+        # httpcore reports connect_tcp (including DNS) and start_tls as
+        # .started/.complete pairs; redirects may open several connections.
+        step, _, phase = event.rpartition('.')
+        if step in ('connection.connect_tcp', 'connection.start_tls'):
+            if phase == 'started':
+                started[step] = time.perf_counter()
+            elif step in started:
+                connect[0] += time.perf_counter() - started.pop(step)
+
+    began = time.perf_counter()
+    try:
+        resp = await client.request(method, url, extensions={'trace': trace}, **kwargs)
+    except Exception as e:
+        metrics.record('transfer', time.perf_counter() - began - connect[0], error=metrics.error_class(e))
+        raise
+    if connect[0]:
+        metrics.record('connect', connect[0])
+    metrics.record('transfer', time.perf_counter() - began - connect[0])
+    return resp
+
+async def _aget(url, **kwargs):
+    return await _arequest("GET", url, **kwargs)
+
+async def _apost(url, **kwargs):
+    return await _arequest("POST", url, **kwargs)
+
+def _get(url, **kwargs):
+    return _run(_aget(url, **kwargs))
+
+def _post(url, **kwargs):
+    return _run(_apost(url, **kwargs))
+
+# Known IR pages. These are seeded into the IR cache and never expire.
+IR_SEEDS = {
+    "NVDA": "https://nvidianews.nvidia.com/",
+    "TSLA": "https://ir.tesla.com",
+    "AAPL": "https://www.apple.com/newsroom/",
+    "AMZN": "https://ir.aboutamazon.com",
+    "MSFT": "https://www.microsoft.com/en-us/investor",
+    "META": "https://investor.fb.com",
+    "GOOG": "https://abc.xyz/investor",
+    "GOOGL": "https://abc.xyz/investor",
+    "AMD": "https://ir.amd.com",
+    "GME": "https://news.gamestop.com/",
+    "PETV": "https://www.petv.com/investors/"
+}
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+def _open_store(cls, setup=None):
+    """Process-wide instance of a store class, falling back to memory if the DB can't be opened."""
+    if cls not in _stores:
+        with _stores_lock:
+            if cls not in _stores:
+                try:
+                    instance = cls()
+                except sqlite3.Error as e:
+                    logger.warning(f"{cls.__name__} unavailable at {store.DB_PATH} ({e}); using memory only.")
+                    instance = cls(":memory:")
+                if setup: setup(instance)
+                _stores[cls] = instance
+    return _stores[cls]
+
+def get_ir_cache():
+    """Returns the process-wide IR URL cache, seeded with IR_SEEDS."""
+    return _open_store(store.IRCache, lambda cache: cache.seed(IR_SEEDS))
+
+def get_news_store():
+    """Returns the process-wide persistent news store."""
+    return _open_store(store.NewsStore)
+
+def _google_fallback_url(ticker):
+    return f"https://www.google.com/search?q={ticker}+investor+relations+news"
+
+def find_ir_page(ticker, refresh=False):
     """
     Robustly finds the Investor Relations page for any given ticker.
+    Results (including failed lookups) are cached on disk; pass refresh=True
+    to rediscover (seeded tickers from IR_SEEDS are never rediscovered).
+    """
+    return _run(async_find_ir_page(ticker, refresh))
+
+async def async_find_ir_page(ticker, refresh=False):
+    """
+    Async version of find_ir_page, running on the shared HTTP engine.
     """
     ticker = ticker.upper()
-    ticker_map = {
-        "NVDA": "https://nvidianews.nvidia.com/",
-        "TSLA": "https://ir.tesla.com",
-        "AAPL": "https://www.apple.com/newsroom/",
-        "AMZN": "https://ir.aboutamazon.com",
-        "MSFT": "https://www.microsoft.com/en-us/investor",
-        "META": "https://investor.fb.com",
-        "GOOG": "https://abc.xyz/investor",
-        "GOOGL": "https://abc.xyz/investor",
-        "AMD": "https://ir.amd.com",
-        "GME": "https://news.gamestop.com/",
-        "PETV": "https://www.petv.com/investors/"
-    }
-    
-    if ticker in ticker_map:
-        return ticker_map[ticker]
+    # SQLite calls (and the first open's schema/seed writes) stay off the engine loop.
+    cache = await asyncio.to_thread(get_ir_cache)
+    cached = await asyncio.to_thread(cache.get, ticker)
+    # Seeded pages are authoritative, even on refresh.
+    if cached and (not refresh or cached[2] == 'seed'):
+        return cached[0]
 
+    errors = []
+    with metrics.labels(ticker, 'Discovery'), metrics.stage('discover'):
+        url = await _adiscover_ir_page(ticker, errors)
+    ok = url != _google_fallback_url(ticker)
+    ttl = None
+    if not ok and errors:
+        logger.info(f"IR discovery failed for {ticker} ({', '.join(errors)} errored); caching the fallback briefly.")
+        ttl = IR_RETRY_TTL
+    elif not ok:
+        logger.info(f"IR discovery failed for {ticker}; caching the fallback.")
+    await asyncio.to_thread(cache.put, ticker, url, ok, ttl=ttl)
+    return url
+
+def _site_url(site):
+    site = (site or '').strip().rstrip('/')
+    if site and not site.startswith(('http://', 'https://')):
+        site = 'https://' + site
+    return site or None
+
+async def _aedgar_sites(ticker, errors):
+    """
+    (investor website, website) from the registrant's EDGAR record; None for
+    each one it lacks. A failed lookup is appended to `errors`.
+    """
+    try:
+        with metrics.stage('edgar'):
+            registrant = await _aedgar_submissions(ticker)
+        if registrant:
+            return _site_url(registrant.investor_website), _site_url(registrant.website)
+    except Exception as e:
+        logger.warning(f"EDGAR registrant lookup failed for {ticker}: {metrics.error_class(e)} {e}")
+        errors.append(EDGAR_SOURCE)
+    return None, None
+
+async def _aprofile_site(ticker, errors):
+    """The company website listed on Yahoo's profile page, or None. A failed lookup is appended to `errors`."""
     logger.info(f"Looking up official domain for {ticker} via Yahoo...")
     try:
-        y_url = f"https://finance.yahoo.com/quote/{ticker}/profile"
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        resp = requests.get(y_url, headers=headers, timeout=5)
-        if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            for a in soup.find_all('a'):
-                href = a.get('href', '')
-                if 'http' in href and not any(x in href for x in ['yahoo.com', 'google.com', 'twitter.com']):
-                    base_url = href.rstrip('/')
-                    ir_paths = ["/investors", "/ir", "/investor-relations", "/newsroom"]
-                    for path in ir_paths:
-                        test_url = base_url + path
-                        try:
-                            if requests.get(test_url, timeout=3, verify=False).status_code < 400:
-                                return test_url
-                        except: continue
-                    return base_url
+        with metrics.stage('profile'):
+            y_url = f"https://finance.yahoo.com/quote/{ticker}/profile"
+            headers = {'User-Agent': 'Mozilla/5.0'}
+            resp = await _aget(y_url, headers=headers, timeout=5)
+            if resp.status_code == 200:
+                return await _in_thread(_parse_profile_site, resp.text)
+            if resp.status_code != 404:
+                errors.append('Yahoo profile')
     except Exception as e:
         logger.error(f"Yahoo domain lookup failed for {ticker}: {e}")
+        errors.append('Yahoo profile')
+    return None
+
+async def _adiscover_ir_page(ticker, errors):
+    """
+    The ticker's IR page, or the Google fallback URL. Lookups that errored
+    (rather than answering "nothing here") are appended to `errors`.
+    """
+    # The registrant's own EDGAR record wins over Yahoo's profile page, but most
+    # registrants leave its website fields blank, so both lookups run at once.
+    # Once Yahoo has named a site, EDGAR only gets EDGAR_GRACE more seconds (a
+    # cold ticker index or the SEC rate limit can hold it up); it keeps running
+    # so its answer is cached for the next lookup.
+    edgar = asyncio.ensure_future(_aedgar_sites(ticker, errors))
+    profile = asyncio.ensure_future(_aprofile_site(ticker, errors))
+    try:
+        await asyncio.wait({edgar, profile}, return_when=asyncio.FIRST_COMPLETED)
+        if not edgar.done() and profile.result():
+            await asyncio.wait({edgar}, timeout=EDGAR_GRACE)
+        if edgar.done() or not profile.result():
+            investor_site, base_url = await edgar
+        else:
+            investor_site, base_url = None, None
+        if investor_site:
+            with metrics.stage('probe'):
+                if await _aprobe_first([investor_site]): return investor_site
+        base_url = base_url or await profile
+    finally:
+        profile.cancel()
+
+    if base_url:
+        ir_paths = ["/investors", "/ir", "/investor-relations", "/newsroom"]
+        with metrics.stage('probe'):
+            return await _aprobe_first([base_url + path for path in ir_paths]) or base_url
 
     domain = ticker.lower() + ".com"
     guesses = [f"https://investor.{domain}", f"https://ir.{domain}", f"https://investors.{domain}"]
-    for url in guesses:
-        try:
-            if requests.get(url, timeout=3, verify=False).status_code < 400: return url
-        except: continue
+    with metrics.stage('probe'):
+        url = await _aprobe_first(guesses)
+    if url: return url
 
     try:
-        query = f"{ticker} investor relations news"
-        for result in search(query):
-            url_str = result.url if hasattr(result, 'url') else result
-            if url_str: return url_str
-            break
-    except: pass
+        with metrics.stage('search'):
+            url_str = await asyncio.to_thread(_google_ir_search, ticker)
+        if url_str: return url_str
+    except Exception as e:
+        logger.warning(f"Google IR search failed for {ticker}: {metrics.error_class(e)} {e}")
+        errors.append('Google search')
 
-    return f"https://www.google.com/search?q={ticker}+investor+relations+news"
+    return _google_fallback_url(ticker)
+
+async def _aprobe(url):
+    """
+    True if `url` answers with a status below 400. Tries HEAD first and only
+    falls back to a streamed GET (headers only, body never read) when the
+    server rejects HEAD. Goes through the host's circuit breaker and adaptive
+    timeout like any other request; an open circuit is a False.
+    """
+    engine = _get_engine()
+    health = engine.host_health(url)
+    try:
+        health.admit()
+    except CircuitOpenError:
+        return False
+    bucket = engine.host_rate(url)
+    started = None
+    try:
+        if bucket: await bucket.acquire()
+        async with engine.host_slot(url), engine.slots:
+            client = engine.client(verify=False)
+            timeout = health.timeout(PROBE_TIMEOUT)
+            started = time.perf_counter()
+            resp = await client.head(url, timeout=timeout)
+            if resp.status_code >= 400 and resp.status_code not in (404, 410):
+                async with client.stream("GET", url, timeout=timeout) as resp:
+                    pass
+    except asyncio.CancelledError:
+        if started is None: health.abandon()
+        else: health.cancelled(time.perf_counter() - started)
+        raise
+    except Exception:
+        health.failure()
+        return False
+    if resp.status_code == 429 or resp.status_code >= 500:
+        health.failure()
+    else:
+        health.success(time.perf_counter() - started)
+    return resp.status_code < 400
+
+async def _aprobe_first(urls):
+    """
+    Probes every candidate URL concurrently and returns the first one that
+    answers, or None. Once a probe succeeds, higher-priority candidates still
+    in flight get PROBE_GRACE seconds to finish so list order breaks ties;
+    every other probe is cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    tasks = [asyncio.ensure_future(_aprobe(url)) for url in urls]
+    rank = {task: i for i, task in enumerate(tasks)}
+    best, deadline, pending = None, None, set(tasks)
+    try:
+        while pending:
+            timeout = None if deadline is None else max(0, deadline - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                if task.result() and (best is None or rank[task] < best):
+                    best = rank[task]
+            if best is not None:
+                deadline = deadline or loop.time() + PROBE_GRACE
+                for task in pending:
+                    if rank[task] > best: task.cancel()
+                pending = {task for task in pending if rank[task] < best}
+    finally:
+        for task in tasks:
+            task.cancel()
+    return urls[best] if best is not None else None
+
+def _parse_profile_site(html):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    for a in soup.find_all('a'):
+        href = a.get('href', '')
+        if 'http' in href and not any(x in href for x in ['yahoo.com', 'google.com', 'twitter.com']):
+            return href.rstrip('/')
+    return None
+
+def _google_ir_search(ticker):
+    from googlesearch import search  # only needed when every other discovery step failed
+    query = f"{ticker} investor relations news"
+    for result in search(query):
+        url_str = result.url if hasattr(result, 'url') else result
+        return url_str
+    return None
+
+class SourceError(Exception):
+    """A source answered with an error status; `retry_after` is in seconds if the server sent one."""
+    def __init__(self, source, status, retry_after=None):
+        super().__init__(f"{source} returned HTTP {status}")
+        self.source = source
+        self.status = status
+        self.retry_after = retry_after
+
+def _check_status(resp, source, strict=True):
+    """
+    Raises SourceError for rate limiting (429) and server errors. With
+    strict=True any non-200 answer is an error.
+    """
+    status = resp.status_code
+    if status == 429 or status >= 500 or (strict and status != 200):
+        retry_after = resp.headers.get('retry-after', '')
+        raise SourceError(source, status, float(retry_after) if retry_after.isdigit() else None)
 
 def _fetch_yahoo(ticker, cutoff_date):
-    results = []
+    return _run(_afetch_yahoo(ticker, cutoff_date)) or []
+
+# The _afetch_* coroutines return a list of items, or None if the source
+# could not be fetched (so incremental scans don't mark it as covered).
+# With raise_errors=True the failure is raised instead (e.g. SourceError).
+async def _afetch_yahoo(ticker, cutoff_date, raise_errors=False):
     try:
-        rss_url = f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker.upper()}&region=US&lang=en-US"
-        resp = requests.get(rss_url, headers={"User-Agent": "Mozilla/5.0"}, timeout=5)
-        if resp.status_code == 200:
-            soup = BeautifulSoup(resp.content, "html.parser")
-            items = soup.find_all("item")
-            for item in items:
-                title_tag = item.find('title')
-                link_tag = item.find('link')
-                date_tag = item.find('pubdate') or item.find('pubDate')
-                title = title_tag.text if title_tag else ""
-                link = link_tag.next_sibling.strip() if link_tag and not link_tag.text else (link_tag.text if link_tag else "")
-                pub_date = date_tag.text if date_tag else ""
-                if not title or not link: continue
-                dt = dateparser.parse(pub_date)
-                if not dt: continue
-                if dt.tzinfo is None: dt = dt.replace(tzinfo=timezone.utc)
-                if dt >= cutoff_date:
-                    results.append({
-                        'ticker': ticker, 'date': dt.strftime("%Y-%m-%d"),
-                        'headline': title[:150], 'link': link, 'source': 'Yahoo/Aggregate'
-                    })
-    except: pass
-    return results
+        with metrics.labels(ticker, 'Yahoo/Aggregate'), metrics.stage('fetch') as timed:
+            rss_url = f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker.upper()}&region=US&lang=en-US"
+            resp = await _aget(rss_url, headers={"User-Agent": "Mozilla/5.0"}, timeout=5)
+            _check_status(resp, 'Yahoo/Aggregate')
+            items = await _in_parser(_parse_feed, resp.content, ticker, cutoff_date, 'Yahoo/Aggregate')
+            timed.items = len(items)
+            return items
+    except Exception as e:
+        logger.warning(f"Yahoo/Aggregate failed for {ticker}: {metrics.error_class(e)} {e}")
+        if raise_errors: raise
+    return None
 
 def _fetch_reddit(ticker, cutoff_date):
+    return _run(_afetch_reddit(ticker, cutoff_date)) or []
+
+async def _afetch_reddit(ticker, cutoff_date, raise_errors=False):
+    try:
+        with metrics.labels(ticker, 'Reddit/WSB'), metrics.stage('fetch') as timed:
+            reddit_url = f"https://www.reddit.com/r/wallstreetbets/search.rss?q={ticker}&sort=new&restrict_sr=on"
+            headers = {"User-Agent": "RaptorScraper/1.0 by TheRaptor"}
+            resp = await _aget(reddit_url, headers=headers, timeout=5)
+            _check_status(resp, 'Reddit/WSB')
+            items = await _in_parser(_parse_feed, resp.content, ticker, cutoff_date, 'Reddit/WSB')
+            timed.items = len(items)
+            return items
+    except Exception as e:
+        logger.warning(f"Reddit/WSB failed for {ticker}: {metrics.error_class(e)} {e}")
+        if raise_errors: raise
+    return None
+
+# Feed parsing (RSS 2.0 and Atom). Entries are read incrementally and
+# discarded once handled; parsing stops after FEED_STOP_AFTER consecutive
+# entries older than the cutoff, since both feeds are newest-first.
+FEED_CHUNK_SIZE = 16384
+FEED_STOP_AFTER = 3
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def _parse_feed_date(text):
+    """Exact RFC-822 (RSS) / ISO-8601 (Atom) parsing, dateparser as a last resort."""
+    text = (text or "").strip()
+    if not text: return None
+    try:
+        dt = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            dt = _dateparser(text)
+    if dt and dt.tzinfo is None: dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+def _feed_entry(elem):
+    """(title, link, date text) of an RSS <item> or Atom <entry>."""
+    title = link = ""
+    dates = {}
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == 'title':
+            title = (child.text or "").strip()
+        elif name == 'link':
+            href = child.get('href')
+            if href is None:
+                link = link or (child.text or "").strip()
+            elif child.get('rel', 'alternate') == 'alternate' or not link:
+                link = href
+        elif name in ('pubDate', 'updated', 'published', 'date'):
+            dates[name] = child.text
+    pub_date = dates.get('pubDate') or dates.get('updated') or dates.get('published') or dates.get('date')
+    return title, link, pub_date
+
+def _iter_feed(content):
+    """Yields (title, link, date text) per entry without building the full tree."""
+    parser = ElementTree.XMLPullParser(events=('end',))
+    for offset in range(0, len(content), FEED_CHUNK_SIZE):
+        parser.feed(content[offset:offset + FEED_CHUNK_SIZE])
+        for _, elem in parser.read_events():
+            if _local_name(elem.tag) in ('item', 'entry'):
+                yield _feed_entry(elem)
+                elem.clear()
+
+def _parse_feed(content, ticker, cutoff_date, source):
+    # Parsing and extraction are interleaved in the streaming parser, so the
+    # feed sources record them as one 'parse' stage.
+    with metrics.stage('parse') as timed:
+        results = _parse_feed_items(content, ticker, cutoff_date, source)
+        timed.items = len(results)
+    return results
+
+def _parse_feed_items(content, ticker, cutoff_date, source):
     results = []
+    stale = 0
     try:
-        reddit_url = f"https://www.reddit.com/r/wallstreetbets/search.rss?q={ticker}&sort=new&restrict_sr=on"
-        headers = {"User-Agent": "RaptorScraper/1.0 by TheRaptor"}
-        resp = requests.get(reddit_url, headers=headers, timeout=5)
-        if resp.status_code == 200:
-            soup = BeautifulSoup(resp.content, "html.parser")
-            entries = soup.find_all("entry")
-            for entry in entries:
-                title_tag = entry.find('title')
-                link_tag = entry.find('link')
-                pub_date_tag = entry.find('updated')
-                title = title_tag.text if title_tag else ""
-                link = link_tag.get('href') if link_tag else ""
-                pub_date = pub_date_tag.text if pub_date_tag else ""
-                if not link or not title: continue
-                dt = dateparser.parse(pub_date)
-                if not dt: continue
-                if dt.tzinfo is None: dt = dt.replace(tzinfo=timezone.utc)
-                if dt >= cutoff_date:
-                    results.append({
-                        'ticker': ticker, 'date': dt.strftime("%Y-%m-%d"),
-                        'headline': title[:150], 'link': link, 'source': 'Reddit/WSB'
-                    })
-    except: pass
+        for title, link, pub_date in _iter_feed(content):
+            if not title or not link: continue
+            dt = _parse_feed_date(pub_date)
+            if not dt: continue
+            if dt < cutoff_date:
+                stale += 1
+                if stale >= FEED_STOP_AFTER: break
+                continue
+            stale = 0
+            results.append({
+                'ticker': ticker, 'date': dt.strftime("%Y-%m-%d"),
+                'headline': title[:150], 'link': link, 'source': source
+            })
+    except ElementTree.ParseError as e:
+        logger.warning(f"{source} feed for {ticker} is malformed, keeping {len(results)} items: {e}")
     return results
 
 def _fetch_ir(url, ticker, cutoff_date):
-    results = []
+    return _run(_afetch_ir(url, ticker, cutoff_date)) or []
+
+async def _afetch_ir(url, ticker, cutoff_date, raise_errors=False):
     try:
-        headers = {"User-Agent": "Mozilla/5.0"}
-        response = requests.get(url, headers=headers, timeout=5, verify=False)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        date_regex = re.compile(r'\d{1,2},?\s+\d{4}|\b\d{4}-\d{2}-\d{2}\b', re.I)
-        for element in soup.find_all(['div', 'p', 'li', 'span', 'td', 'a']):
-            text = element.get_text(separator=" ").strip()
-            if len(text) < 5 or not date_regex.search(text): continue
-            months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-            if not any(m in text.lower() for m in months) and '-' not in text: continue
-            dt = dateparser.parse(text, settings={'STRICT_PARSING': False})
+        with metrics.labels(ticker, 'Official IR'), metrics.stage('fetch') as timed:
+            headers = {"User-Agent": "Mozilla/5.0"}
+            response = await _aget(url, headers=headers, timeout=5, verify=False)
+            # IR sites often serve their news list with odd statuses; only
+            # throttling and server errors count as failures.
+            _check_status(response, 'Official IR', strict=False)
+            items = await _in_parser(_parse_ir, response.content, url, ticker, cutoff_date, response.encoding)
+            timed.items = len(items)
+            return items
+    except Exception as e:
+        logger.warning(f"Official IR failed for {ticker}: {metrics.error_class(e)} {e}")
+        if raise_errors: raise
+    return None
+
+# IR page extraction. Elements are matched on their own text; the innermost
+# element carrying a date wins and its nearest headline link becomes the item.
+_IR_TAGS = frozenset(['div', 'p', 'li', 'span', 'td', 'a'])
+_IR_SKIP_TAGS = frozenset(['script', 'style', 'noscript', 'template', 'svg'])
+_IR_MAX_TEXT = 300  # longer texts are containers, not date lines
+_IR_DATEPARSER_MAX_TEXT = 80
+_IR_LINK_LEVELS = 6
+
+_MONTHS = {m: i for i, m in enumerate(['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1)}
+_MONTH_RE = r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?'
+_DATE_PREFILTER = re.compile(r'\d{1,2},?\s+\d{4}|\b\d{4}-\d{2}-\d{2}\b|\b\d{1,2}\s+[a-z]{3,9}\.?,?\s+\d{4}\b', re.I)
+_DATE_MDY = re.compile(rf'\b{_MONTH_RE}\s+(\d{{1,2}})(?:st|nd|rd|th)?,?\s+(\d{{4}})\b', re.I)
+_DATE_DMY = re.compile(rf'\b(\d{{1,2}})\s+{_MONTH_RE},?\s+(\d{{4}})\b', re.I)
+_DATE_ISO = re.compile(r'\b(\d{4})-(\d{2})-(\d{2})\b')
+_MONTH_WORD = re.compile(r'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec', re.I)
+
+# dateparser is the slow fallback for dates the exact parsers don't know. It
+# is slow to import and loads language data on first use, so it is loaded on
+# demand, restricted to DATEPARSER_LANGUAGES and kept for the process.
+DATEPARSER_LANGUAGES = ['en']
+
+@lru_cache(maxsize=None)
+def _date_data_parser():
+    from dateparser.date import DateDataParser
+    return DateDataParser(languages=DATEPARSER_LANGUAGES)
+
+def _dateparser(text):
+    return _date_data_parser().get_date_data(text).date_obj
+
+def _warm_parsers():
+    """Imports the HTML parser and loads dateparser's language data."""
+    import bs4  # noqa: F401
+    _dateparser("January 5, 2024")
+
+def _parse_date_fast(text):
+    """
+    Exact parser for the date formats IR pages actually use ("Jan 5, 2024",
+    "January 5th 2024", "5 January 2024", "2024-01-05"). Returns a UTC
+    datetime or None.
+    """
+    for regex, order in ((_DATE_MDY, 'mdy'), (_DATE_ISO, 'ymd'), (_DATE_DMY, 'dmy')):
+        for m in regex.finditer(text):
+            if order == 'mdy':
+                month, day, year = _MONTHS[m.group(1).lower()], m.group(2), m.group(3)
+            elif order == 'dmy':
+                day, month, year = m.group(1), _MONTHS[m.group(2).lower()], m.group(3)
+            else:
+                year, month, day = m.groups()
+            try:
+                return datetime(int(year), int(month), int(day), tzinfo=timezone.utc)
+            except ValueError:
+                continue
+    return None
+
+def _parse_ir_date(text):
+    if len(text) < 5 or not _DATE_PREFILTER.search(text): return None
+    if not _MONTH_WORD.search(text) and '-' not in text: return None
+    dt = _parse_date_fast(text)
+    if dt is None and len(text) <= _IR_DATEPARSER_MAX_TEXT:
+        dt = _dateparser(text)
+        if dt and dt.tzinfo is None: dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+def _ir_dated_elements(soup):
+    """
+    Single post-order pass over the tree. Each element's text is built once
+    from its children's cached text (capped at _IR_MAX_TEXT) and only checked
+    for a date if no descendant already matched, so nested wrappers around
+    the same date line are reported once. Yields (element, datetime).
+    """
+    from bs4 import NavigableString, Tag
+    texts = {}
+    matched = set()
+    stack = [(soup, False)]
+    while stack:
+        node, visited = stack.pop()
+        if not visited:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node.contents)
+                         if isinstance(child, Tag) and child.name not in _IR_SKIP_TAGS)
+            continue
+        parts, length, child_matched = [], 0, False
+        for child in node.contents:
+            if isinstance(child, Tag):
+                part = texts.pop(id(child), None)
+                child_matched = child_matched or id(child) in matched
+            elif type(child) is NavigableString:
+                part = child.strip()
+            else:
+                continue
+            if part is None:
+                length = _IR_MAX_TEXT + 1
+            elif part:
+                parts.append(part)
+                length += len(part) + 1
+        text = " ".join(parts) if length <= _IR_MAX_TEXT else None
+        texts[id(node)] = text
+        if child_matched:
+            matched.add(id(node))
+        elif text and node.name in _IR_TAGS:
+            dt = _parse_ir_date(text)
             if dt:
-                if dt.tzinfo is None: dt = dt.replace(tzinfo=timezone.utc)
-                if dt >= cutoff_date:
-                    link, headline = None, None
-                    curr = element
-                    for _ in range(6):
-                        if not curr: break
-                        a_tags = curr.find_all('a')
-                        for a in a_tags:
-                            h = a.get_text().strip()
-                            href = a.get('href', '')
-                            if href and len(h) > 12: link, headline = href, h; break
-                        if link: break
-                        curr = curr.parent
-                    if link and headline:
-                        if link.startswith('/'):
-                            from urllib.parse import urljoin
-                            link = urljoin(url, link)
-                        results.append({
-                            'ticker': ticker, 'date': dt.strftime("%Y-%m-%d"),
-                            'headline': headline.replace('\n', ' ').strip()[:150],
-                            'link': link, 'source': 'Official IR'
-                        })
-    except: pass
+                matched.add(id(node))
+                yield node, dt
+
+def _ir_headline_link(element, cache):
+    """Nearest <a> with a real headline, searching up to _IR_LINK_LEVELS ancestors."""
+    curr = element
+    for _ in range(_IR_LINK_LEVELS):
+        if curr is None: break
+        key = id(curr)
+        if key not in cache:
+            cache[key] = None
+            for a in curr.find_all('a', href=True):
+                h = a.get_text().strip()
+                if len(h) > 12:
+                    cache[key] = (a['href'], h)
+                    break
+        if cache[key]:
+            return cache[key]
+        curr = curr.parent
+    return None
+
+def _parse_ir(html, url, ticker, cutoff_date, encoding=None):
+    """IR page news rows; `html` may be the raw body, decoded here like httpx's response.text."""
+    results = []
+    try:
+        with metrics.stage('parse'):
+            from bs4 import BeautifulSoup
+            if isinstance(html, bytes):
+                html = html.decode(encoding or 'utf-8', errors='replace')
+            soup = BeautifulSoup(html, 'html.parser')
+        with metrics.stage('extract') as timed:
+            link_cache, seen = {}, set()
+            for element, dt in _ir_dated_elements(soup):
+                if dt < cutoff_date: continue
+                found = _ir_headline_link(element, link_cache)
+                if not found: continue
+                link, headline = found
+                if link.startswith('/'):
+                    link = urljoin(url, link)
+                if link in seen: continue
+                seen.add(link)
+                results.append({
+                    'ticker': ticker, 'date': dt.strftime("%Y-%m-%d"),
+                    'headline': headline.replace('\n', ' ').strip()[:150],
+                    'link': link, 'source': 'Official IR'
+                })
+            timed.items = len(results)
+    except Exception as e:
+        logger.warning(f"IR page parse failed for {ticker}: {e}")
     return results
 
-def get_news(url, ticker, days_lookback=7, recursive=True):
+# News sources scanned for every ticker.
+NEWS_SOURCES = ('Yahoo/Aggregate', 'Reddit/WSB', 'Official IR')
+
+def _source_fetches(url, ticker):
+    """
+    {source: fetch(cutoff, raise_errors=False)} for one ticker. `url` may be a
+    future of the IR page (discovery still running); only the IR fetch waits
+    for it, and it fetches nothing if discovery found no page.
+    """
+    async def fetch_ir(cutoff, raise_errors=False):
+        page = await url if asyncio.isfuture(url) else url
+        return await _afetch_ir(page, ticker, cutoff, raise_errors) if page else None
+    return {
+        'Yahoo/Aggregate': lambda cutoff, raise_errors=False: _afetch_yahoo(ticker, cutoff, raise_errors),
+        'Reddit/WSB': lambda cutoff, raise_errors=False: _afetch_reddit(ticker, cutoff, raise_errors),
+        'Official IR': fetch_ir,
+    }
+
+# Sources scanned within this many seconds are served straight from the news
+# store. The background poller marks its scans fresh for longer (about one
+# poll interval), since it will be back before they go stale.
+STORE_MAX_AGE = 300
+
+def _recent(mark, max_age):
+    """True if the mark's scan is younger than `max_age` or the `fresh_for` its scanner set; max_age=0 never is."""
+    return bool(mark and max_age and time.time() - mark['last_scan'] < max(max_age, mark.get('fresh_for') or 0))
+
+def _is_fresh(mark, cutoff_date, max_age):
+    return _recent(mark, max_age) and mark['covered_from'] <= cutoff_date.isoformat()
+
+# Overlap kept below a source's high-water mark, for items that show up late.
+INCREMENTAL_OVERLAP = timedelta(days=1)
+
+def _incremental_cutoff(mark, cutoff_date):
+    """Cutoff to fetch a source with, given its scan mark and the requested cutoff."""
+    if not mark or mark['covered_from'] > cutoff_date.isoformat() or not mark['high_water']:
+        return cutoff_date
+    high_water = datetime.strptime(mark['high_water'], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    return max(cutoff_date, high_water - INCREMENTAL_OVERLAP)
+
+def get_news(url, ticker, days_lookback=7, recursive=True, limit=100, offset=0, incremental=True,
+             max_age=STORE_MAX_AGE, deadline=None):
+    return _run(async_get_news(url, ticker, days_lookback, recursive, limit, offset, incremental, max_age,
+                               deadline))
+
+async def async_get_news(url, ticker, days_lookback=7, recursive=True, limit=100, offset=0, incremental=True,
+                         max_age=STORE_MAX_AGE, deadline=None):
+    """
+    Fetches Yahoo, Reddit and the IR page concurrently over the shared client.
+    With incremental=True (the default) each source is only parsed back to
+    its stored high-water mark and the result is served from the news store,
+    so long lookbacks and pagination (limit/offset, limit=None for all) come
+    from disk. Sources scanned in the last `max_age` seconds, e.g. by the
+    background poller, are not fetched at all. With `deadline` (seconds) the
+    result is returned by then with whatever sources have answered; the rest
+    are cancelled (their stored items are still included when incremental).
+    """
     now = datetime.now(timezone.utc)
     cutoff_date = now - timedelta(days=days_lookback)
     logger.info(f"Speed-Scouting {ticker} across all sources...")
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        f1 = executor.submit(_fetch_yahoo, ticker, cutoff_date)
-        f2 = executor.submit(_fetch_reddit, ticker, cutoff_date)
-        f3 = executor.submit(_fetch_ir, url, ticker, cutoff_date)
-        results = f1.result() + f2.result() + f3.result()
-
-    unique_results = []
-    seen_links = set()
-    for item in results:
-        if item['link'] not in seen_links:
-            unique_results.append(item)
-            seen_links.add(item['link'])
+    deadline_at = None if deadline is None else time.perf_counter() + deadline
+    return await _agather_news(url, ticker, cutoff_date, limit, offset, incremental, max_age,
+                               deadline_at=deadline_at)
+
+async def _aby_deadline(jobs, deadline_at, ticker, missed=None):
+    """
+    Runs {source: coroutine} concurrently and returns {source: result} of
+    those done by `deadline_at` (a time.perf_counter() value, None to wait
+    for all). The others are cancelled and appended to `missed`.
+    """
+    tasks = {asyncio.ensure_future(job): source for source, job in jobs.items()}
+    timeout = None if deadline_at is None else max(0.0, deadline_at - time.perf_counter())
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+        logger.warning(f"{tasks[task]} missed the deadline for {ticker}; returning partial results")
+        if missed is not None: missed.append(tasks[task])
+    return {tasks[task]: task.result() for task in done}
+
+async def _agather_news(url, ticker, cutoff_date, limit=100, offset=0, incremental=True, max_age=STORE_MAX_AGE,
+                        emit=None, deadline_at=None, missed=None):
+    """
+    Gathers all sources for one ticker (`url` as in _source_fetches). If
+    `emit` is given it is called with a {'type': 'news', 'ticker', 'source',
+    'items', 'elapsed'} event as soon as each source is ready, before the
+    merged result is returned. Sources not done by `deadline_at` are left out
+    and listed in `missed`.
+    """
+    started = time.perf_counter()
+    fetches = _source_fetches(url, ticker)
+    since = cutoff_date.strftime("%Y-%m-%d")
+
+    def emit_source(source, items):
+        if emit:
+            emit({'type': 'news', 'ticker': ticker, 'source': source, 'items': items,
+                  'elapsed': round(time.perf_counter() - started, 3)})
+
+    if not incremental:
+        async def fetch(source):
+            batch = await fetches[source](cutoff_date)
+            emit_source(source, _merge_news(batch or []))
+            return batch
+        batches = await _aby_deadline({source: fetch(source) for source in NEWS_SOURCES}, deadline_at, ticker, missed)
+        news = _merge_news([item for batch in batches.values() if batch for item in batch])
+        return news[offset:None if limit is None else offset + limit]
+
+    news_store = await asyncio.to_thread(get_news_store)
+    marks = await asyncio.to_thread(news_store.marks, ticker)
+
+    async def refresh(source):
+        mark = marks.get(source)
+        if not _is_fresh(mark, cutoff_date, max_age):
+            cutoff = _incremental_cutoff(mark, cutoff_date)
+            batch = await fetches[source](cutoff)
+            if batch is not None:
+                await _arecord_news(ticker, source, batch, cutoff)
+        if emit:
+            items, _ = await asyncio.to_thread(news_store.query, ticker, since, [source], limit)
+            emit_source(source, items)
+
+    await _aby_deadline({source: refresh(source) for source in NEWS_SOURCES}, deadline_at, ticker, missed)
+    # Dedup across sources before paging, so pages are not thinned afterwards.
+    items, _ = await asyncio.to_thread(news_store.query, ticker, since, None, None)
+    return dedupe_news(items)[offset:None if limit is None else offset + limit]
+
+async def _arecord_news(ticker, source, batch, cutoff, fresh_for=None):
+    news_store = await asyncio.to_thread(get_news_store)
+    # The store holds one row per canonical link; a higher-priority source
+    # takes it over from one that got there first, as dedupe_news would.
+    rank = SOURCE_PRIORITY.get(source, len(SOURCE_PRIORITY))
+    replaces = [other for other, other_rank in SOURCE_PRIORITY.items() if other_rank > rank]
+    added = await asyncio.to_thread(news_store.record_scan, ticker, source, batch,
+                                    cutoff.isoformat(), canonical_url, fresh_for, replaces)
+    if added: logger.info(f"{ticker} {source}: {added} new items")
+    return added
+
+# Query parameters that only track the click, never select the content.
+TRACKING_PARAMS = frozenset([
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid', 'mkt_tok', '_hsenc', '_hsmi',
+    'guccounter', 'guce_referrer', 'guce_referrer_sig', 'ncid', 'soc_src', 'soc_trk', '.tsrc', 'yptr',
+    'ref_src', 'ref_url', 'cmpid',
+])
+# Redirect wrappers: host -> query parameters that carry the real target.
+REDIRECT_HOSTS = {
+    'google.com': ('url', 'q'),
+    'out.reddit.com': ('url',),
+    'l.facebook.com': ('u',),
+    'cts.businesswire.com': ('url',),
+    'c212.net': ('u',),
+    'lnks.gd': ('url',),
+}
+
+def _unwrap_redirect(parts):
+    """The wrapped target URL of a known redirector, or None."""
+    host = parts.netloc.lower().removeprefix('www.')
+    if host == 'r.search.yahoo.com':
+        # Yahoo search clicks: .../RU=<escaped target>/RK=...
+        match = re.search(r'/RU=([^/]+)', parts.path)
+        return unquote(match.group(1)) if match else None
+    keys = REDIRECT_HOSTS.get(host)
+    if keys:
+        params = dict(parse_qsl(parts.query))
+        for key in keys:
+            if params.get(key, '').startswith(('http://', 'https://')):
+                return params[key]
+    return None
+
+def canonical_url(link):
+    """
+    Canonical form of a news link, used as the store key and for cross-source
+    dedup: redirect wrappers unwrapped, tracking parameters dropped, scheme and
+    host lower-cased without "www.", no trailing slash. Fragments are kept:
+    hash-routed IR sites (#/news/12, #!id=3, #id=1) tell items apart by them.
+    """
+    parts = urlparse(link.strip())
+    for _ in range(3):
+        target = _unwrap_redirect(parts)
+        if not target:
+            break
+        parts = urlparse(target)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if k.lower() not in TRACKING_PARAMS and not k.lower().startswith('utm_')])
+    path = parts.path.rstrip('/') or '/'
+    host = parts.netloc.lower().removeprefix('www.')
+    return (f"{parts.scheme.lower()}://{host}{path}{'?' + query if query else ''}"
+            f"{'#' + parts.fragment if parts.fragment else ''}")
+
+# Cross-source dedup: the same story from several sources collapses to the
+# copy from the highest-priority source.
+SOURCE_PRIORITY = {'Official IR': 0, 'Yahoo/Aggregate': 1, 'Reddit/WSB': 2}
+DEDUP_THRESHOLD = 0.7  # Jaccard similarity of headline word bigrams
+DEDUP_MAX_DAYS = 2     # only stories dated this close together can be the same
+
+# MinHash signatures of 16 bands x 4 rows put headline pairs with Jaccard
+# ~0.5+ in a shared LSH bucket; candidates are then checked exactly.
+_LSH_BANDS, _LSH_ROWS = 16, 4
+_MINHASH_PRIME = (1 << 61) - 1
+_MINHASH_A, _MINHASH_B = np.random.default_rng(1).integers(1, 1 << 31, size=(2, _LSH_BANDS * _LSH_ROWS),
+                                                          dtype=np.uint64)
+_HEADLINE_WORDS = re.compile(r'[a-z0-9]+(?:\.[0-9]+)?')
+
+def _headline_shingles(headline):
+    words = _HEADLINE_WORDS.findall(headline.lower())
+    if len(words) < 3:
+        return frozenset(words)
+    return frozenset(f"{a} {b}" for a, b in zip(words, words[1:]))
+
+def _minhash(shingles):
+    hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+    return ((np.outer(hashes, _MINHASH_A) + _MINHASH_B) % _MINHASH_PRIME).min(axis=0)
 
+def dedupe_news(items, threshold=DEDUP_THRESHOLD, max_days=DEDUP_MAX_DAYS):
+    """
+    Collapses the same story reported by several sources. Items with the same
+    canonical URL form one cluster; otherwise an item joins a cluster whose
+    representative (its first item) has a near-identical headline
+    (MinHash/LSH candidate with bigram Jaccard >= `threshold`) dated within
+    `max_days` of it, so clusters never chain across longer spans. Each
+    cluster keeps its highest-priority source (Official IR first); survivors
+    keep their input order.
+    """
+    cluster = []   # per item, the index of its cluster's representative
+    by_url = {}
+    reps = {}      # representative -> (date ordinal, shingles)
+    buckets = {}   # LSH bucket -> representatives with a member in it (dict as ordered set)
+    for i, item in enumerate(items):
+        url = canonical_url(item['link'])
+        if url in by_url:
+            cluster.append(cluster[by_url[url]])
+            continue
+        by_url[url] = i
+        shingles = _headline_shingles(item['headline'])
+        if not shingles:
+            cluster.append(i)
+            continue
+        date = datetime.strptime(item['date'], "%Y-%m-%d").toordinal()
+        signature = _minhash(shingles)
+        keys = [(band, signature[band * _LSH_ROWS:(band + 1) * _LSH_ROWS].tobytes()) for band in range(_LSH_BANDS)]
+        rep = _match_cluster(keys, buckets, reps, date, shingles, threshold, max_days)
+        if rep is None:
+            rep = i
+            reps[i] = (date, shingles)
+        cluster.append(rep)
+        for key in keys:
+            buckets.setdefault(key, {})[rep] = None
+
+    best = {}
+    for i, item in enumerate(items):
+        rank = (SOURCE_PRIORITY.get(item['source'], len(SOURCE_PRIORITY)), i)
+        if cluster[i] not in best or rank < best[cluster[i]][0]:
+            best[cluster[i]] = (rank, i)
+    keep = sorted(i for _, i in best.values())
+    return [items[i] for i in keep]
+
+def _match_cluster(keys, buckets, reps, date, shingles, threshold, max_days):
+    """The first representative sharing an LSH bucket that is close enough in date and headline, or None."""
+    seen = set()
+    for key in keys:
+        for rep in buckets.get(key, ()):
+            if rep in seen:
+                continue
+            seen.add(rep)
+            rep_date, rep_shingles = reps[rep]
+            if abs(date - rep_date) <= max_days and \
+                    len(shingles & rep_shingles) >= threshold * len(shingles | rep_shingles):
+                return rep
+    return None
+
+def _merge_news(results):
+    unique_results = dedupe_news(results)
     unique_results.sort(key=lambda x: x['date'], reverse=True)
-    return unique_results[:100]
+    return unique_results
+
+def news_batch(results):
+    """
+    One NewsBatch, newest first, of the news in scan_many/scan_events ticker
+    results (or plain item lists), with sources in NEWS_SOURCES order.
+    """
+    batches = [NewsBatch.from_items(r['news'] if isinstance(r, dict) else r, NEWS_SOURCES) for r in results]
+    return NewsBatch.concat(batches).newest_first()
+
+MATCH_MODES = ('exact', 'token', 'fuzzy')
+
+class KeywordSet:
+    """
+    Comma-separated keywords compiled once for one match mode:
+      exact - case-insensitive substring, as a single regex alternation
+      token - rapidfuzz token_set_ratio (word order and repeats don't matter)
+      fuzzy - rapidfuzz partial_ratio (catches typos and variations)
+    Headlines are scored against every keyword in one batched cdist call.
+    """
+    def __init__(self, keywords, mode='fuzzy', threshold=75):
+        if mode not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode {mode!r}; expected one of {MATCH_MODES}")
+        self.keywords = keywords
+        self.mode = mode
+        self.threshold = threshold
+        self.pattern = re.compile('|'.join(map(re.escape, keywords))) if mode == 'exact' else None
+        self.scorer = fuzz.token_set_ratio if mode == 'token' else fuzz.partial_ratio
+
+    def mask(self, headlines, workers=-1):
+        """One bool per headline: does it match any keyword?"""
+        headlines = [h.lower() for h in headlines]
+        if not self.keywords:
+            return [True] * len(headlines)
+        if not headlines:
+            return []
+        if self.pattern:
+            return [self.pattern.search(h) is not None for h in headlines]
+        # One batched row per keyword, scored only against headlines no earlier
+        # keyword matched - the vectorized form of the old loop's early break.
+        matched = np.zeros(len(headlines), dtype=bool)
+        pending = np.arange(len(headlines))
+        for keyword in self.keywords:
+            scores = process.cdist([keyword], [headlines[i] for i in pending], scorer=self.scorer,
+                                   score_cutoff=self.threshold, dtype=np.uint8, workers=workers)[0]
+            hits = scores >= self.threshold
+            matched[pending[hits]] = True
+            pending = pending[~hits]
+            if not len(pending):
+                break
+        return matched.tolist()
+
+    def filter(self, items, workers=-1):
+        return [item for item, ok in zip(items, self.mask([i['headline'] for i in items], workers)) if ok]
+
+@lru_cache(maxsize=64)
+def compile_keywords(keywords, mode='fuzzy', threshold=75):
+    """Cached KeywordSet for a comma-separated keyword string (or a sequence of keywords)."""
+    if isinstance(keywords, str):
+        keywords = keywords.split(",")
+    keywords = tuple(dict.fromkeys(k.strip().lower() for k in keywords if k.strip()))
+    return KeywordSet(keywords, mode, threshold)
+
+def match_keywords(items, keywords, mode='fuzzy', threshold=75, workers=-1):
+    """News items whose headline matches any of `keywords`; all items if there are none."""
+    if not isinstance(keywords, str):
+        keywords = tuple(keywords)
+    return compile_keywords(keywords, mode, threshold).filter(items, workers)
+
+SEC_SOURCE = 'SEC Filings'
+
+# sec-api.io quotas and latency are the tightest constraint, so lookups are
+# batched into one `ticker:(A OR B ...)` query, paged, filtered by form type
+# server-side and cached per (ticker, form types).
+SEC_API_URL = "https://api.sec-api.io"
+SEC_PAGE_SIZE = 50       # sec-api.io's maximum page size
+SEC_MAX_PAGES = 5        # per query, before the still-short tickers are queried on their own
+SEC_BATCH_SIZE = 25      # tickers per query
+SEC_BATCH_WINDOW = 0.05  # seconds concurrent single-ticker lookups wait to share a query
+SEC_CACHE_TTL = 300
+# Tickers whose filings may be listed under another class of shares.
+SEC_FALLBACK_TICKERS = {'GOOG': 'GOOGL'}
+
+class FilingsCache:
+    """
+    In-memory TTL cache of filings keyed by (ticker, form types). An entry
+    answers any limit up to the number of filings it holds, or any limit at
+    all when it is `complete` (sec-api had no more).
+    """
+    def __init__(self, ttl=SEC_CACHE_TTL):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def get(self, ticker, form_types, limit):
+        with self.lock:
+            entry = self.entries.get((ticker, form_types))
+        if not entry or entry[0] < time.monotonic():
+            return None
+        _, filings, complete = entry
+        return filings[:limit] if complete or len(filings) >= limit else None
+
+    def put(self, ticker, form_types, filings, complete):
+        with self.lock:
+            self.entries[(ticker, form_types)] = (time.monotonic() + self.ttl, filings, complete)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+filings_cache = FilingsCache()
+
+def _form_types_key(form_types):
+    return tuple(sorted(set(form_types))) if form_types else ()
+
+def _filing_row(f):
+    return {
+        'date': (f.get('filedAt') or '')[:10],  # just YYYY-MM-DD
+        'type': f.get('formType', 'Unknown'),
+        'description': f.get('description', ''),
+        'link': f.get('linkToFilingDetails', '')
+    }
+
+async def _asec_query(api_key, query, start=0, size=SEC_PAGE_SIZE):
+    """One page of a sec-api.io query, newest first; raises SourceError on error statuses."""
+    payload = {
+        "query": {"query_string": {"query": query}},
+        "from": str(start),
+        "size": str(size),
+        "sort": [{"filedAt": {"order": "desc"}}]
+    }
+    response = await _apost(f"{SEC_API_URL}?token={api_key}", json=payload, timeout=5)
+    if response.status_code != 200:
+        logger.error(f"SEC-API.io Error {response.status_code}: {response.text[:200]}")
+    _check_status(response, SEC_SOURCE)
+    return response.json()
+
+async def _asec_search(api_key, tickers, form_types, limit):
+    """
+    Up to `limit` newest filings for each ticker from one paged query.
+    Returns {ticker: (filings, complete)}.
+    """
+    owners = {t.replace(".", "-"): t for t in tickers}
+    query = f"ticker:({' OR '.join(owners)})"
+    if form_types:
+        query += " AND formType:(" + " OR ".join(f'"{form}"' for form in form_types) + ")"
+    found = {t: [] for t in tickers}
+    short = set(tickers)
+    lone = tickers[0] if len(tickers) == 1 else None
+    size = min(SEC_PAGE_SIZE, limit * len(tickers))
+    start, exhausted = 0, False
+    with metrics.stage('fetch') as timed:
+        for _ in range(max(SEC_MAX_PAGES, -(-limit // size))):
+            data = await _asec_query(api_key, query, start, size)
+            page = data.get('filings', [])
+            total = data.get('total', {})
+            total = total.get('value', 0) if isinstance(total, dict) else total
+            for f in page:
+                # A lone ticker owns every row; shared queries split rows by
+                # the filing's own ticker field (spelled BRK.B or BRK-B).
+                ticker = lone or owners.get((f.get('ticker') or '').upper().replace(".", "-"))
+                if ticker in short:
+                    found[ticker].append(_filing_row(f))
+                    if len(found[ticker]) >= limit:
+                        short.discard(ticker)
+            start += len(page)
+            if len(page) < size or start >= total:
+                exhausted = True
+                break
+            if not short:
+                break
+        timed.items = sum(len(filings) for filings in found.values())
+    results = {t: (found[t], exhausted or t not in short) for t in tickers}
+    # One busy ticker can fill every page; query the ones left short on their own.
+    if short and not exhausted and len(tickers) > 1:
+        for t in short:
+            results[t] = (await _asec_search(api_key, [t], form_types, limit))[t]
+    return results
 
-def search_edgar_filings(ticker, api_key, limit=5):
+def search_edgar_filings(ticker, api_key, limit=5, form_types=None):
     """
     Fetches recent EDGAR filings for a ticker using sec-api.io.
     Requires a valid API key.
     """
+    return _run(async_search_edgar_filings(ticker, api_key, limit, form_types=form_types))
+
+def search_edgar_filings_many(tickers, api_key, limit=5, form_types=None):
+    """
+    Recent EDGAR filings for many tickers, {ticker: filings}, in as few
+    sec-api.io queries as possible. `form_types` (e.g. ['10-K', '8-K'])
+    filters server-side; `limit` may exceed one page.
+    """
+    return _run(async_search_edgar_filings_many(tickers, api_key, limit, form_types))
+
+async def async_search_edgar_filings_many(tickers, api_key, limit=5, form_types=None, raise_errors=False):
+    tickers = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+    if not api_key or not tickers:
+        return {t: [] for t in tickers}
+    forms = _form_types_key(form_types)
+    results, missing = {}, []
+    for ticker in tickers:
+        cached = filings_cache.get(ticker, forms, limit)
+        if cached is None:
+            missing.append(ticker)
+        else:
+            results[ticker] = cached
+    if not missing:
+        return results
+
+    try:
+        with metrics.labels(source=SEC_SOURCE):
+            batches = [missing[i:i + SEC_BATCH_SIZE] for i in range(0, len(missing), SEC_BATCH_SIZE)]
+            found = {}
+            for batch in await asyncio.gather(*(_asec_search(api_key, b, forms, limit) for b in batches)):
+                found.update(batch)
+            fallbacks = {t: SEC_FALLBACK_TICKERS[t] for t in missing if not found[t][0] and t in SEC_FALLBACK_TICKERS}
+            if fallbacks:
+                alias = await _asec_search(api_key, list(set(fallbacks.values())), forms, limit)
+                for ticker, other in fallbacks.items():
+                    found[ticker] = alias[other]
+    except Exception as e:
+        logger.error(f"Failed to fetch EDGAR filings for {', '.join(missing)}: {metrics.error_class(e)} {e}")
+        if raise_errors: raise
+        return {**results, **{t: [] for t in missing}}
+
+    for ticker in missing:
+        filings, complete = found[ticker]
+        filings_cache.put(ticker, forms, filings, complete)
+        results[ticker] = filings
+    return results
+
+class _EdgarBatcher:
+    """
+    Coalesces concurrent single-ticker lookups (one per ticker in a scan, or
+    poller jobs that come due together) into one multi-ticker query.
+    """
+    def __init__(self):
+        self.pending = {}
+        self.flushing = set()
+
+    async def get(self, ticker, api_key, limit, form_types):
+        loop = asyncio.get_running_loop()
+        key = (api_key, limit, form_types)
+        batch = self.pending.get(key)
+        if batch is None:
+            batch = self.pending[key] = {}
+            # Flush outside the first caller's context so its trace and labels don't leak in.
+            loop.call_later(SEC_BATCH_WINDOW, self._flush, key, context=contextvars.Context())
+        future = loop.create_future()
+        batch.setdefault(ticker, []).append(future)
+        return await future
+
+    def _flush(self, key):
+        task = asyncio.ensure_future(self._fetch(key, self.pending.pop(key)))
+        self.flushing.add(task)
+        task.add_done_callback(self.flushing.discard)
+
+    async def _fetch(self, key, batch):
+        api_key, limit, form_types = key
+        try:
+            results = await async_search_edgar_filings_many(list(batch), api_key, limit, form_types, raise_errors=True)
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done(): future.set_exception(e)
+            return
+        for ticker, futures in batch.items():
+            for future in futures:
+                if not future.done(): future.set_result(results[ticker])
+
+_edgar_batcher = _EdgarBatcher()
+
+async def async_search_edgar_filings(ticker, api_key, limit=5, raise_errors=False, form_types=None):
     if not api_key:
         return []
-    
-    # Clean ticker input
     ticker = ticker.strip().upper()
-    
-    # Handle explicit mapping for known separators
-    search_ticker = ticker.replace(".", "-")
-    
-    url = f"https://api.sec-api.io?token={api_key}"
-
-    # Try 1: Specific Ticker Search (e.g. "ticker:AAPL")
-    query = f"ticker:{search_ticker}"
-    
-    payload = {
-        "query": { "query_string": { "query": query } },
-        "from": "0",
-        "size": str(limit),
-        "sort": [{ "filedAt": { "order": "desc" } }]
-    }
+    try:
+        return await _edgar_batcher.get(ticker, api_key, limit, _form_types_key(form_types))
+    except Exception:
+        # Already logged once for the whole batch.
+        if raise_errors: raise
+    return []
+
+def check_edgar_key(api_key):
+    """Validates a sec-api.io key with a one-filing query; returns AAPL's filing count or raises SourceError."""
+    data = _run(_asec_query(api_key.strip(), "ticker:AAPL", 0, 1))
+    total = data.get('total', {})
+    return total.get('value', 0) if isinstance(total, dict) else total
+
+async def _afilings(ticker, api_key, limit, max_age=STORE_MAX_AGE, form_types=None):
+    """
+    Filings from the news store if they were fetched recently, otherwise from
+    sec-api.io. The store only holds unfiltered filings, so form-type
+    filtered lookups always go through the cached sec-api path.
+    """
+    if form_types:
+        return await async_search_edgar_filings(ticker, api_key, limit, form_types=form_types)
+    news_store = await asyncio.to_thread(get_news_store)
+    mark = (await asyncio.to_thread(news_store.marks, ticker)).get(SEC_SOURCE)
+    if _recent(mark, max_age):
+        return await asyncio.to_thread(news_store.filings, ticker, limit)
+    filings = await async_search_edgar_filings(ticker, api_key, limit)
+    if filings:
+        await asyncio.to_thread(news_store.record_filings, ticker, filings)
+    return filings
+
+# EDGAR's own bulk data (no API key): the ticker -> CIK index and each
+# registrant's submissions JSON. The SEC asks for a User-Agent naming the
+# requester; set SEC_USER_AGENT to your own contact.
+EDGAR_SOURCE = 'EDGAR'
+SEC_USER_AGENT = os.environ.get("SEC_USER_AGENT", "IR-News-Scraper/1.0 ir-news-scraper@users.noreply.github.com")
+SEC_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+SEC_TICKERS_PATH = os.environ.get("SCOUT_SEC_TICKERS",
+                                  os.path.join(os.path.dirname(store.DB_PATH), "company_tickers.json"))
+SEC_TICKERS_MAX_AGE = 7 * 86400
+SEC_TICKERS_RETRY = 3600  # after a failed download, seconds before trying again
+
+_ticker_index = None
+_ticker_index_state = {'lock': None, 'failed_at': 0.0}
+SEC_SUBMISSIONS_MAX = 512  # registrants whose parsed filings are kept in memory (least recently used goes first)
+_submissions = OrderedDict()  # CIK -> (edgar.Submissions, asyncio.Lock)
+
+def _sec_headers():
+    return {'User-Agent': SEC_USER_AGENT}
+
+def get_ticker_index(refresh=False):
+    """The SEC ticker -> CIK index, loaded from SEC_TICKERS_PATH (downloaded when missing or stale)."""
+    return _run(_aticker_index(refresh))
+
+async def _aticker_index(refresh=False):
+    global _ticker_index
+    if _ticker_index is not None and not refresh:
+        return _ticker_index
+    state = _ticker_index_state
+    state['lock'] = state['lock'] or asyncio.Lock()
+    async with state['lock']:
+        if _ticker_index is not None and not refresh:
+            return _ticker_index
+        path = SEC_TICKERS_PATH
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except OSError:
+            age = None
+        if (refresh or age is None or age > SEC_TICKERS_MAX_AGE) and time.time() - state['failed_at'] > SEC_TICKERS_RETRY:
+            try:
+                resp = await _aget(SEC_TICKERS_URL, headers=_sec_headers(), timeout=30, cache=False)
+                _check_status(resp, EDGAR_SOURCE)
+                index = await asyncio.to_thread(edgar.TickerIndex.from_json, resp.content)
+                await asyncio.to_thread(_write_file, path, resp.content)
+                logger.info(f"Loaded SEC ticker index ({len(index)} tickers) into {path}")
+                _ticker_index = index
+                return index
+            except Exception as e:
+                state['failed_at'] = time.time()
+                logger.warning(f"SEC ticker index download failed: {metrics.error_class(e)} {e}")
+        if age is not None:
+            _ticker_index = await asyncio.to_thread(edgar.TickerIndex.load, path)
+        return _ticker_index
+
+def _write_file(path, content):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(content)
+    os.replace(tmp, path)
+
+async def _aedgar_submissions(ticker):
+    """
+    The registrant behind `ticker` with its filings merged from the latest
+    submissions JSON, or None if the ticker is not in the SEC index. Re-reads
+    are conditional GETs through the response cache and only new filings are
+    parsed.
+    """
+    index = await _aticker_index()
+    cik = index.cik(ticker) if index else None
+    if not cik:
+        return None
+    entry = _submissions.get(cik)
+    if entry is None:
+        entry = _submissions[cik] = (edgar.Submissions(cik), asyncio.Lock())
+        while len(_submissions) > SEC_SUBMISSIONS_MAX:
+            _submissions.popitem(last=False)
+    else:
+        _submissions.move_to_end(cik)
+    registrant, lock = entry
+    async with lock:
+        resp = await _aget(edgar.submissions_url(cik), headers=_sec_headers(), timeout=10)
+        _check_status(resp, EDGAR_SOURCE)
+        added = await _in_thread(registrant.update, resp.content)
+    if added: logger.info(f"EDGAR: {added} new filings for {ticker} (CIK {cik})")
+    return registrant
+
+def get_edgar_filings(ticker, limit=5, form_types=None):
+    """
+    Recent filings for a ticker straight from EDGAR's submissions data, in
+    search_edgar_filings' shape. Needs no API key, only the SEC ticker index.
+    """
+    return _run(async_get_edgar_filings(ticker, limit, form_types))
 
+async def async_get_edgar_filings(ticker, limit=5, form_types=None, raise_errors=False):
+    ticker = ticker.strip().upper()
     try:
-        response = requests.post(url, json=payload, timeout=5)
-        
-        # If the first search yields nothing (e.g. user searched GOOG but needed GOOGL and map didn't catch it), try fallback
-        if response.status_code == 200:
-            data = response.json()
-            total = data.get('total', {}).get('value', 0) if isinstance(data.get('total'), dict) else data.get('total', 0)
-            
-            # If 0 results, maybe we need to try adding "L" for Alphabet or just generally handle 0 results gracefully
-            if total == 0 and "GOOG" in ticker and not ticker.endswith("L"):
-                 query = "ticker:GOOGL"
-                 payload["query"]["query_string"]["query"] = query
-                 response = requests.post(url, json=payload, timeout=5)
-                 data = response.json()
-                 total = data.get('total', {}).get('value', 0) if isinstance(data.get('total'), dict) else data.get('total', 0)
-
-            filings = []
-            for f in data.get('filings', []):
-                filed_at = f.get('filedAt', '')
-                try:
-                    # Extract just YYYY-MM-DD
-                    date_str = filed_at[:10]
-                except:
-                    date_str = filed_at
-                
-                filings.append({
-                    'date': date_str,
-                    'type': f.get('formType', 'Unknown'),
-                    'description': f.get('description', ''),
-                    'link': f.get('linkToFilingDetails', '')
-                })
+        with metrics.labels(ticker, EDGAR_SOURCE), metrics.stage('fetch') as timed:
+            registrant = await _aedgar_submissions(ticker)
+            if not registrant:
+                return []
+            filings = registrant.select(limit, form_types)
+            # Older filings live in extra pages; only load them when asked for.
+            for name in registrant.unloaded_pages():
+                if limit is not None and len(filings) >= limit:
+                    break
+                resp = await _aget(f"https://data.sec.gov/submissions/{name}", headers=_sec_headers(), timeout=10)
+                _check_status(resp, EDGAR_SOURCE)
+                await _in_thread(registrant.add_page, name, resp.content)
+                filings = registrant.select(limit, form_types)
+            timed.items = len(filings)
             return filings
-        else:
-            logger.error(f"SEC-API.io Error {response.status_code}: {response.text}")
     except Exception as e:
-        logger.error(f"Failed to fetch EDGAR filings for {ticker}: {e}")
-    
+        logger.error(f"Failed to read EDGAR submissions for {ticker}: {metrics.error_class(e)} {e}")
+        if raise_errors: raise
     return []
+
+async def async_poll_source(source, ticker, days_lookback=7, api_key=None, filings_limit=20, fresh_for=None):
+    """
+    Refreshes one source for one ticker into the news store, incrementally.
+    Unlike the scan path, failures are raised (SourceError carries the HTTP
+    status and Retry-After) so a scheduler can back off. `fresh_for` is how
+    many seconds scans may serve the result from the store (the scheduler's
+    interval). Returns the number of items fetched.
+    """
+    ticker = ticker.strip().upper()
+    news_store = await asyncio.to_thread(get_news_store)
+    if source == SEC_SOURCE:
+        filings = await async_search_edgar_filings(ticker, api_key, filings_limit, raise_errors=True)
+        await asyncio.to_thread(news_store.record_filings, ticker, filings, fresh_for)
+        return len(filings)
+    url = await async_find_ir_page(ticker) if source == 'Official IR' else None
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_lookback)
+    mark = (await asyncio.to_thread(news_store.marks, ticker)).get(source)
+    cutoff = _incremental_cutoff(mark, cutoff_date)
+    batch = await _source_fetches(url, ticker)[source](cutoff, raise_errors=True) or []
+    await _arecord_news(ticker, source, batch, cutoff, fresh_for)
+    return len(batch)
+
+async def _ascan_ticker(ticker, cutoff_date, api_key, filings_limit, ticker_slots, limit=100, emit=None,
+                        incremental=True, form_types=None, deadline=None):
+    async with ticker_slots:
+        started = time.perf_counter()
+        deadline_at = None if deadline is None else started + deadline
+        timings = metrics.start_trace()
+        result = {'ticker': ticker, 'url': None, 'news': [], 'filings': [], 'error': None, 'partial': []}
+
+        def remaining():
+            return None if deadline_at is None else max(0.0, deadline_at - time.perf_counter())
+
+        async def get_filings():
+            found = await _afilings(ticker, api_key, filings_limit, form_types=form_types)
+            if emit:
+                emit({'type': 'filings', 'ticker': ticker, 'filings': found,
+                      'elapsed': round(time.perf_counter() - started, 3)})
+            return found
+
+        # Only the IR source needs discovery, so Yahoo, Reddit and EDGAR start
+        # right away. Discovery is shielded: if the IR source misses the deadline,
+        # discovery still finishes (and is cached) in the background.
+        discovery = asyncio.ensure_future(async_find_ir_page(ticker))
+        filings = asyncio.ensure_future(get_filings()) if api_key else None
+        try:
+            result['news'] = await _agather_news(asyncio.shield(discovery), ticker, cutoff_date, limit,
+                                                 incremental=incremental, emit=emit, deadline_at=deadline_at,
+                                                 missed=result['partial'])
+            try:
+                result['url'] = await asyncio.wait_for(asyncio.shield(discovery), remaining())
+                if not result['url']:
+                    result['error'] = 'Could not find Investor Relations page.'
+            except asyncio.TimeoutError:
+                logger.warning(f"IR page discovery missed the deadline for {ticker}; finishing in the background")
+            if filings:
+                try:
+                    result['filings'] = await asyncio.wait_for(filings, remaining())
+                except asyncio.TimeoutError:
+                    logger.warning(f"{SEC_SOURCE} missed the deadline for {ticker}")
+                    result['partial'].append(SEC_SOURCE)
+        except Exception as e:
+            logger.error(f"Error processing {ticker}: {e}")
+            result['error'] = f"Internal Error: {str(e)}"
+            if filings: filings.cancel()
+        result['elapsed'] = round(time.perf_counter() - started, 3)
+        # A copy: discovery left running in the background keeps appending to the trace.
+        result['timings'] = list(timings)
+        return result
+
+def scan_events(tickers, days_lookback=7, api_key=None, filings_limit=5, max_workers=MAX_WORKERS, limit=100,
+                form_types=None, deadline=None):
+    """
+    Scans a batch of tickers on the shared HTTP engine and yields events as
+    soon as they are ready:
+      {'type': 'news', 'ticker', 'source', 'items', 'elapsed'}  per source
+      {'type': 'filings', 'ticker', 'filings', 'elapsed'}       if api_key
+      {'type': 'ticker', 'ticker', 'url', 'news', 'filings', 'error', 'partial', 'elapsed', 'timings'}
+    The 'ticker' event is always the last one for its ticker; 'news' holds up
+    to `limit` merged items (None for all), more can be paged out of
+    get_news_store(). 'news' events come before cross-source dedup, so they
+    can carry items (up to `limit` per source) that the merged list drops. 'timings' lists the scan's per-stage records (see
+    metrics.py). At most `max_workers` tickers are in flight; requests
+    overall and per host are capped at MAX_WORKERS and PER_HOST_LIMIT.
+    Filings (filtered server-side to `form_types` if given) are looked up in
+    shared multi-ticker sec-api.io queries. With `deadline` (seconds from
+    the start of a ticker's scan) every ticker is answered by then with the
+    sources that made it; 'partial' lists the ones that did not. IR page
+    discovery still running then finishes in the background ('url' is None).
+    """
+    tickers = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+    if not tickers:
+        return
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_lookback)
+    logger.info(f"Batch-scouting {len(tickers)} tickers, {max_workers} at a time...")
+    events = queue.Queue()
+    ticker_slots = asyncio.Semaphore(max_workers)
+    futures = []
+    for ticker in tickers:
+        future = _submit(_ascan_ticker(ticker, cutoff_date, api_key, filings_limit, ticker_slots, limit, events.put,
+                                       form_types=form_types, deadline=deadline))
+        future.add_done_callback(lambda f: events.put(None if f.cancelled() else ('done', f)))
+        futures.append(future)
+    try:
+        for _ in tickers:
+            while True:
+                event = events.get()
+                if event is None:
+                    break
+                if isinstance(event, tuple):
+                    yield {'type': 'ticker', **event[1].result()}
+                    break
+                yield event
+    finally:
+        for future in futures:
+            future.cancel()
+
+def scan_many(tickers, days_lookback=7, api_key=None, filings_limit=5, max_workers=MAX_WORKERS, limit=100,
+              form_types=None, deadline=None):
+    """
+    Like scan_events, but only yields the final result per ticker:
+    {'ticker', 'url', 'news', 'filings', 'error', 'partial', 'elapsed', 'timings'}.
+    """
+    for event in scan_events(tickers, days_lookback, api_key, filings_limit, max_workers, limit, form_types,
+                             deadline):
+        if event['type'] == 'ticker':
+            yield {k: v for k, v in event.items() if k != 'type'}
+
+PROFILERS = ('cprofile', 'pyinstrument')
+
+def profile_scan(ticker, days_lookback=7, api_key=None, profiler='cprofile', incremental=False):
+    """
+    Scans one ticker with cProfile or pyinstrument attached to the engine
+    loop; parsing runs inline on the loop so it shows up too. By default the
+    news store is bypassed so every source is really fetched. Returns
+    (result, report text). Anything else running on the engine at the same
+    time ends up in the profile as well.
+    """
+    if profiler not in PROFILERS:
+        raise ValueError(f"Unknown profiler {profiler!r}; expected one of {PROFILERS}")
+    return _run(_aprofile_scan(ticker.strip().upper(), days_lookback, api_key, profiler, incremental))
+
+async def _aprofile_scan(ticker, days_lookback, api_key, profiler, incremental):
+    _profiling.set(True)
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_lookback)
+    scan = lambda: _ascan_ticker(ticker, cutoff_date, api_key, 5, asyncio.Semaphore(1), None, incremental=incremental)
+    if profiler == 'pyinstrument':
+        from pyinstrument import Profiler
+        prof = Profiler(async_mode='enabled')
+        prof.start()
+        try:
+            result = await scan()
+        finally:
+            prof.stop()
+        return result, prof.output_text(unicode=True)
+
+    import cProfile, io, pstats
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        result = await scan()
+    finally:
+        prof.disable()
+    report = io.StringIO()
+    pstats.Stats(prof, stream=report).sort_stats('cumulative').print_stats(40)
+    return result, report.getvalue()
+
+def format_timings(timings):
+    """Plain-text table of a scan's timing records."""
+    lines = [f"{'source':<18}{'stage':<10}{'ms':>9}{'items':>7}  error"]
+    for t in timings:
+        items = '' if t['items'] is None else t['items']
+        lines.append(f"{t['source'] or '':<18}{t['stage']:<10}{t['seconds'] * 1000:>9.1f}{items:>7}  {t['error'] or ''}")
+    return "\n".join(lines)
+
+def metrics_text():
+    """Prometheus exposition of the per-stage scan metrics and the response cache counters."""
+    cache = cache_stats()
+    extra = {f"scout_http_cache_{name}_total": ('counter', f"Response cache {name.replace('_', ' ')}.", cache[name])
+             for name in ('hits', 'revalidated', 'misses', 'evictions', 'bytes_saved')}
+    extra['scout_http_cache_entries'] = ('gauge', "Responses held in the cache.", cache['entries'])
+    extra['scout_http_cache_bytes'] = ('gauge', "Body bytes held in the cache.", cache['bytes'])
+    hosts = host_stats()
+    extra['scout_hosts_open_circuits'] = ('gauge', "Hosts currently fast-failed by the circuit breaker.",
+                                          sum(h['state'] != 'closed' for h in hosts.values()))
+    extra['scout_hedged_requests_total'] = ('counter', "Requests sent a second time to cut a slow tail.",
+                                            _hedges['sent'])
+    extra['scout_hedged_requests_won_total'] = ('counter', "Hedged requests answered first by the second copy.",
+                                                _hedges['won'])
+    return metrics.render(extra)
+
+def warm_up():
+    """
+    Does a first scan's one-time work ahead of it: parser imports and
+    dateparser data, the HTTP engine, the on-disk stores, the parse pool and
+    the SEC ticker index. Safe to call from several threads; returns the
+    seconds each step took.
+    """
+    steps = {
+        'parsers': _warm_parsers,
+        'engine': _get_engine,
+        'stores': lambda: (get_ir_cache(), get_news_store()),
+        'parse_pool': _get_parse_pool,
+        'sec_index': lambda: _run(_aticker_index()),
+    }
+    timings = {}
+    for name, step in steps.items():
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            logger.warning(f"Warm-up step {name} failed: {metrics.error_class(e)} {e}")
+        timings[name] = round(time.perf_counter() - started, 4)
+    return timings
+
+def warm_ir_cache(tickers, refresh=False):
+    """
+    Resolves IR pages for a list of tickers concurrently so later scans hit
+    the cache. Yields (ticker, url) as each one finishes.
+    """
+    tickers = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+    futures = {_submit(async_find_ir_page(t, refresh)): t for t in tickers}
+    for future in as_completed(futures):
+        try:
+            yield futures[future], future.result()
+        except Exception as e:
+            logger.error(f"Warm-up failed for {futures[future]}: {e}")
+            yield futures[future], None
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="scout", description="IR News Scraper engine utilities.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    warm = commands.add_parser("warm", help="Pre-resolve IR pages into the on-disk cache.")
+    warm.add_argument("tickers", nargs="*", help="Tickers to resolve.")
+    warm.add_argument("--file", help="Read tickers from a file (one per line or comma separated).")
+    warm.add_argument("--refresh", action="store_true", help="Ignore cached entries and rediscover.")
+    sec_index = commands.add_parser("sec-index", help="Download the SEC ticker -> CIK index used for EDGAR lookups.")
+    sec_index.add_argument("tickers", nargs="*", help="Tickers to look up after loading.")
+    prof = commands.add_parser("profile", help="Scan one ticker under a profiler and print where the time went.")
+    prof.add_argument("ticker")
+    prof.add_argument("--days", type=int, default=7)
+    prof.add_argument("--profiler", choices=PROFILERS, default="cprofile")
+    prof.add_argument("--sec-key", help="sec-api.io key, to include the EDGAR lookup.")
+    prof.add_argument("--incremental", action="store_true", help="Use the news store like a normal scan.")
+    prof.add_argument("--output", help="Write the profiler report here instead of stdout.")
+    args = parser.parse_args(argv)
+
+    if args.command == "warm":
+        tickers = list(args.tickers)
+        if args.file:
+            with open(args.file) as f:
+                tickers += [t for line in f for t in line.replace(",", " ").split()]
+        if not tickers:
+            parser.error("no tickers given")
+        for ticker, url in warm_ir_cache(tickers, refresh=args.refresh):
+            print(f"{ticker}\t{url or 'ERROR'}")
+    elif args.command == "sec-index":
+        index = get_ticker_index(refresh=True)
+        if index is None:
+            parser.exit(1, "SEC ticker index unavailable\n")
+        print(f"{len(index)} tickers in {SEC_TICKERS_PATH}")
+        for ticker in args.tickers:
+            print(f"{ticker.upper()}\t{index.cik(ticker) or '-'}\t{index.title(ticker) or ''}")
+    elif args.command == "profile":
+        result, report = profile_scan(args.ticker, args.days, args.sec_key, args.profiler, args.incremental)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(report)
+        else:
+            print(report)
+        print(f"{result['ticker']}: {len(result['news'])} items in {result['elapsed']:.2f}s"
+              f"{' (' + result['error'] + ')' if result['error'] else ''}")
+        print(format_timings(result['timings']))
+
+if __name__ == "__main__":
+    main()
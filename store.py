@@ -0,0 +1,242 @@
+import os
+import sqlite3
+import threading
+import time
+
+from newsbatch import NewsBatch
+
+# Everything scout persists lives in one SQLite file next to the code unless
+# SCOUT_DB points elsewhere.
+DB_PATH = os.environ.get("SCOUT_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "scout.db"))
+
+class SQLiteStore:
+    """
+    Small base class for the on-disk stores: one shared connection guarded by
+    a lock, so it can be used from Flask worker threads and the engine loop.
+    """
+    schema = ""
+    # Columns added to a table after its first release, {table: [(column, type)]};
+    # files written by older versions get them on open.
+    added_columns = {}
+
+    def __init__(self, path=None):
+        self.path = path or DB_PATH
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.lock, self.conn:
+            self.conn.executescript(self.schema)
+            for table, columns in self.added_columns.items():
+                present = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+                for column, kind in columns:
+                    if column not in present:
+                        self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {kind}")
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class IRCache(SQLiteStore):
+    """
+    Resolved Investor Relations URLs per ticker. Successful lookups are kept
+    for `ttl` seconds, failed ones (ok=0) for `negative_ttl`, unless put() is
+    given its own `ttl`. Seed rows never expire.
+    """
+    schema = """
+        CREATE TABLE IF NOT EXISTS ir_pages (
+            ticker TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            ok INTEGER NOT NULL,
+            source TEXT NOT NULL,
+            resolved_at REAL NOT NULL,
+            expires_at REAL
+        );
+    """
+
+    def __init__(self, path=None, ttl=30 * 86400, negative_ttl=86400):
+        super().__init__(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    def seed(self, mapping):
+        """Upserts hard-coded ticker -> URL rows; seeds win over discovered rows."""
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                """INSERT INTO ir_pages (ticker, url, ok, source, resolved_at, expires_at)
+                   VALUES (?, ?, 1, 'seed', ?, NULL)
+                   ON CONFLICT(ticker) DO UPDATE SET
+                       url = excluded.url, ok = 1, source = 'seed', expires_at = NULL""",
+                [(ticker.upper(), url, now) for ticker, url in mapping.items()]
+            )
+
+    def get(self, ticker):
+        """Returns (url, ok, source) for a fresh entry, or None if missing or expired."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT url, ok, source, expires_at FROM ir_pages WHERE ticker = ?", (ticker.upper(),)
+            ).fetchone()
+        if not row or (row[3] is not None and row[3] < time.time()):
+            return None
+        return row[0], bool(row[1]), row[2]
+
+    def put(self, ticker, url, ok=True, source="discovered", ttl=None):
+        now = time.time()
+        expires_at = now + (ttl or (self.ttl if ok else self.negative_ttl))
+        with self.lock, self.conn:
+            self.conn.execute(
+                """INSERT OR REPLACE INTO ir_pages (ticker, url, ok, source, resolved_at, expires_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (ticker.upper(), url, int(ok), source, now, expires_at)
+            )
+
+class NewsStore(SQLiteStore):
+    """
+    Every news item scout has extracted, keyed by ticker and normalized link,
+    the latest SEC filings per ticker, and per-(ticker, source) scan marks:
+      covered_from - oldest cutoff this source has been fully scanned back to
+      high_water   - newest item date seen from this source
+      fresh_for    - seconds the scan counts as fresh, if its scanner said
+                     (the poller sets it from its interval); NULL otherwise
+    """
+    schema = """
+        CREATE TABLE IF NOT EXISTS news (
+            ticker TEXT NOT NULL,
+            link_key TEXT NOT NULL,
+            date TEXT NOT NULL,
+            headline TEXT NOT NULL,
+            link TEXT NOT NULL,
+            source TEXT NOT NULL,
+            first_seen REAL NOT NULL,
+            PRIMARY KEY (ticker, link_key)
+        );
+        CREATE INDEX IF NOT EXISTS news_by_date ON news (ticker, date DESC);
+        CREATE TABLE IF NOT EXISTS filings (
+            ticker TEXT NOT NULL,
+            link TEXT NOT NULL,
+            date TEXT NOT NULL,
+            type TEXT NOT NULL,
+            description TEXT NOT NULL,
+            PRIMARY KEY (ticker, link)
+        );
+        CREATE TABLE IF NOT EXISTS scan_marks (
+            ticker TEXT NOT NULL,
+            source TEXT NOT NULL,
+            covered_from TEXT NOT NULL,
+            high_water TEXT,
+            last_scan REAL NOT NULL,
+            fresh_for REAL,
+            PRIMARY KEY (ticker, source)
+        );
+    """
+    added_columns = {'scan_marks': [('fresh_for', 'REAL')]}
+
+    def marks(self, ticker):
+        """{source: {'covered_from', 'high_water', 'last_scan', 'fresh_for'}} for a ticker."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT source, covered_from, high_water, last_scan, fresh_for FROM scan_marks WHERE ticker = ?",
+                (ticker,)
+            ).fetchall()
+        return {r[0]: {'covered_from': r[1], 'high_water': r[2], 'last_scan': r[3], 'fresh_for': r[4]}
+                for r in rows}
+
+    def record_scan(self, ticker, source, items, covered_from, key=lambda link: link, fresh_for=None, replaces=()):
+        """
+        Stores a source's items and advances its marks. A link already stored
+        is kept as first seen, unless its row came from one of `replaces`
+        (lower-priority sources): then this source's copy takes it over.
+        Returns the number of new items.
+        """
+        now = time.time()
+        newest = max((item['date'] for item in items), default=None)
+        rows = [(ticker, key(i['link']), i['date'], i['headline'], i['link'], i['source'], now) for i in items]
+        with self.lock, self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                """INSERT OR IGNORE INTO news (ticker, link_key, date, headline, link, source, first_seen)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""", rows
+            )
+            added = self.conn.total_changes - before
+            if replaces and added < len(rows):
+                self.conn.executemany(
+                    f"""UPDATE news SET date = ?, headline = ?, link = ?, source = ?
+                        WHERE ticker = ? AND link_key = ? AND source IN ({','.join('?' * len(replaces))})""",
+                    [(r[2], r[3], r[4], r[5], r[0], r[1], *replaces) for r in rows]
+                )
+            self.conn.execute(
+                """INSERT INTO scan_marks (ticker, source, covered_from, high_water, last_scan, fresh_for)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(ticker, source) DO UPDATE SET
+                       covered_from = MIN(covered_from, excluded.covered_from),
+                       high_water = MAX(COALESCE(high_water, ''), COALESCE(excluded.high_water, '')),
+                       last_scan = excluded.last_scan, fresh_for = excluded.fresh_for""",
+                (ticker, source, covered_from, newest, now, fresh_for)
+            )
+        return added
+
+    def query(self, tickers, since, sources=None, limit=100, offset=0):
+        """
+        Items for `tickers` dated on or after `since` (YYYY-MM-DD), newest
+        first. Returns (items, total) so callers can page with limit/offset;
+        limit=None returns everything.
+        """
+        tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+        where = f"ticker IN ({','.join('?' * len(tickers))}) AND date >= ?"
+        params = [*tickers, since]
+        if sources:
+            where += f" AND source IN ({','.join('?' * len(sources))})"
+            params += list(sources)
+        with self.lock:
+            total = self.conn.execute(f"SELECT COUNT(*) FROM news WHERE {where}", params).fetchone()[0]
+            rows = self.conn.execute(
+                f"""SELECT ticker, date, headline, link, source FROM news WHERE {where}
+                    ORDER BY date DESC, first_seen, rowid LIMIT ? OFFSET ?""",
+                params + [-1 if limit is None else limit, offset]
+            ).fetchall()
+        items = [{'ticker': r[0], 'date': r[1], 'headline': r[2], 'link': r[3], 'source': r[4]} for r in rows]
+        return items, total
+
+    def query_batch(self, tickers, since, sources=None):
+        """All items query() would return, newest first, as a NewsBatch built straight from the rows."""
+        tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+        where = f"ticker IN ({','.join('?' * len(tickers))}) AND date >= ?"
+        params = [*tickers, since]
+        if sources:
+            where += f" AND source IN ({','.join('?' * len(sources))})"
+            params += list(sources)
+        with self.lock:
+            rows = self.conn.execute(
+                f"""SELECT ticker, date, headline, link, source FROM news WHERE {where}
+                    ORDER BY date DESC, first_seen, rowid""", params
+            ).fetchall()
+        return NewsBatch.from_rows(rows)
+
+    def record_filings(self, ticker, filings, fresh_for=None):
+        """Upserts a ticker's filings and marks the SEC source as scanned now."""
+        now = time.time()
+        newest = max((f['date'] for f in filings), default=None)
+        with self.lock, self.conn:
+            self.conn.executemany(
+                """INSERT OR REPLACE INTO filings (ticker, link, date, type, description)
+                   VALUES (?, ?, ?, ?, ?)""",
+                [(ticker, f['link'], f['date'], f['type'], f['description']) for f in filings]
+            )
+            self.conn.execute(
+                """INSERT INTO scan_marks (ticker, source, covered_from, high_water, last_scan, fresh_for)
+                   VALUES (?, 'SEC Filings', '', ?, ?, ?)
+                   ON CONFLICT(ticker, source) DO UPDATE SET
+                       high_water = MAX(COALESCE(high_water, ''), COALESCE(excluded.high_water, '')),
+                       last_scan = excluded.last_scan, fresh_for = excluded.fresh_for""",
+                (ticker, newest, now, fresh_for)
+            )
+
+    def filings(self, ticker, limit=5):
+        """Newest stored filings for a ticker, in search_edgar_filings' shape."""
+        with self.lock:
+            rows = self.conn.execute(
+                """SELECT date, type, description, link FROM filings WHERE ticker = ?
+                   ORDER BY date DESC, rowid DESC LIMIT ?""",
+                (ticker, limit)
+            ).fetchall()
+        return [{'date': r[0], 'type': r[1], 'description': r[2], 'link': r[3]} for r in rows]
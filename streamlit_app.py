@@ -1,13 +1,28 @@
 
 import streamlit as st
 import scout
+import threading
 from datetime import datetime
 import pandas as pd
-import requests
+from newsbatch import NewsBatch
+
+# Tickers with more news than this get a table instead of one card per item.
+NEWS_CARD_LIMIT = 25
+# Seconds a ticker's scan may take; sources still running then are skipped.
+SCAN_DEADLINE = 20
 
 # Page Config
 st.set_page_config(page_title="IR News Scraper", page_icon="🦅", layout="wide")
 
+@st.cache_resource(show_spinner=False)
+def warm_scout():
+    # Once per server process, not per rerun: load parsers, engine, stores and
+    # the SEC index in the background so the first scan doesn't pay for them.
+    threading.Thread(target=scout.warm_up, name="scout-warm-up", daemon=True).start()
+    return True
+
+warm_scout()
+
 # Custom CSS for "The Raptor" branding
 st.markdown("""
     <style>
@@ -66,18 +81,10 @@ with st.sidebar:
         if st.button("🔌 Test API Connection"):
             with st.spinner("Testing key..."):
                 try:
-                    test_url = f"https://api.sec-api.io?token={edgar_api_key}"
-                    test_payload = {
-                        "query": { "query_string": { "query": "ticker:AAPL" } },
-                        "from": "0", "size": "1"
-                    }
-                    r = requests.post(test_url, json=test_payload, timeout=5)
-                    if r.status_code == 200:
-                        data = r.json()
-                        total = data.get('total', {}).get('value', 0) if isinstance(data.get('total'), dict) else data.get('total', 0)
-                        st.success(f"✅ Connected! Found {total} AAPL filings.")
-                    else:
-                        st.error(f"❌ API Error {r.status_code}: {r.text[:200]}")
+                    total = scout.check_edgar_key(edgar_api_key)
+                    st.success(f"✅ Connected! Found {total} AAPL filings.")
+                except scout.SourceError as e:
+                    st.error(f"❌ API Error {e.status}")
                 except Exception as e:
                     st.error(f"❌ Connection Failed: {e}")
     
@@ -97,7 +104,11 @@ with st.sidebar:
 
     st.divider()
     st.subheader("⚙️ Settings")
-    match_threshold = st.slider("Match Sensitivity", 0, 100, 75, help="Higher = stricter matches.")
+    match_mode = st.radio("Keyword Matching", options=list(scout.MATCH_MODES), index=2, horizontal=True,
+                          help="Exact: substring. Token: same words in any order. Fuzzy: catches typos and variations.")
+    match_threshold = st.slider("Match Sensitivity", 0, 100, 75, help="Higher = stricter matches.",
+                                disabled=match_mode == 'exact')
+    show_timings = st.toggle("Show Scan Timings", help="Per-source connect, transfer, parse and extract times.")
 
 # Logic
 if scan_clicked:
@@ -108,76 +119,69 @@ if scan_clicked:
         
         # Create columns for tickers
         cols = st.columns(len(tickers_list))
-        
+        statuses = {}
         for idx, ticker in enumerate(tickers_list):
             with cols[idx]:
                 st.markdown(f"### 📊 {ticker}")
-                # Data containers
-                news = []
-                filings = []
-                
-                # --- PHASE 1: Data Gathering (Status Bar) ---
-                with st.status(f"Hunting {ticker}...", expanded=True) as status:
-                    # 1. Find IR Page
-                    st.write("🔎 Locating Official IR Page...")
-                    url = scout.find_ir_page(ticker)
-                    
-                    if not url:
-                        st.error("Discovery Failed")
-                        status.update(label=f"❌ {ticker} Failed", state="error")
-                        continue
-                    
-                    # 2. Fetch News
-                    st.write(f"🦅 Scanning sources for news ({timeframe} days)...")
-                    raw_news = scout.get_news(url, ticker, days_lookback=timeframe)
-                    
-                    # 3. Filter News
-                    filtered_news = [n for n in raw_news if n.get('source') in source_filters]
-                    
-                    if filter_keywords and filtered_news:
-                        from rapidfuzz import process, fuzz
-                        keywords = [k.strip().lower() for k in filter_keywords.split(",") if k.strip()]
-                        
-                        final_filtered = []
-                        for item in filtered_news:
-                            headline = item['headline'].lower()
-                            is_match = False
-                            for kw in keywords:
-                                if fuzz.partial_ratio(kw, headline) >= match_threshold:
-                                    is_match = True
-                                    break
-                            if is_match:
-                                final_filtered.append(item)
-                        news = final_filtered
-                    else:
-                        news = filtered_news
-
-                    # 4. Fetch Filings (if key present)
+                statuses[ticker] = st.status(f"Hunting {ticker}...", expanded=True)
+                with statuses[ticker]:
+                    st.write(f"🦅 Locating IR page and scanning sources ({timeframe} days)...")
                     if edgar_api_key:
                         st.write("🏛️ Fetching Official SEC Filings...")
-                        filings = scout.search_edgar_filings(ticker, edgar_api_key)
-                    
-                    status.update(label=f"✅ {ticker}: Ready", state="complete", expanded=False)
+
+        # All tickers are scanned on one shared pool; render each as it finishes.
+        form_types = filing_types if edgar_api_key else None
+        shown_news = []
+        for result in scout.scan_many(tickers_list, days_lookback=timeframe, api_key=edgar_api_key or None,
+                                      form_types=form_types, deadline=SCAN_DEADLINE):
+            ticker = result['ticker']
+            status = statuses[ticker]
+            with cols[tickers_list.index(ticker)]:
+                # --- PHASE 1: Data Gathering (Status Bar) ---
+                # Yahoo and Reddit news is still shown when no IR page was found.
+                if result['error'] and not result['news']:
+                    with status:
+                        st.error(result['error'])
+                    status.update(label=f"❌ {ticker} Failed", state="error")
+                    continue
+
+                # Filter News
+                filtered_news = [n for n in result['news'] if n.get('source') in source_filters]
+                
+                if filter_keywords and filtered_news:
+                    news = scout.match_keywords(filtered_news, filter_keywords, match_mode, match_threshold)
+                else:
+                    news = filtered_news
+
+                shown_news.append(news)
+                filings = result['filings']
+                status.update(label=f"✅ {ticker}: Ready ({result['elapsed']:.1f}s)", state="complete", expanded=False)
+                if result['error']:
+                    st.caption(f"⚠️ {result['error']}")
+                if result['partial']:
+                    st.caption(f"⏱️ Too slow, skipped: {', '.join(result['partial'])}")
+
+                if show_timings and result['timings']:
+                    with st.expander(f"⏱️ Timings ({result['elapsed']:.2f}s)"):
+                        timings = pd.DataFrame(result['timings'])
+                        timings['ms'] = (timings['seconds'] * 1000).round(1)
+                        st.dataframe(timings[['source', 'stage', 'ms', 'items', 'error']],
+                                     hide_index=True, use_container_width=True)
 
                 # --- PHASE 2: Display Results ---
                 
                 # SECTION: OFFICIAL FILINGS (High Priority)
                 if edgar_api_key:
                     st.subheader("🏛️ SEC Filings", divider="blue")
+                    # Filings arrive already filtered to the selected form types.
                     if filings:
-                        # Apply filing type filter
-                        filtered_filings = filings
-                        if filing_types:  # If specific types selected (not "All")
-                            filtered_filings = [f for f in filings if f['type'] in filing_types]
-                        
-                        if filtered_filings:
-                            for f in filtered_filings:
-                                st.markdown(f"""
-                                **{f['date']}** • `{f['type']}`  
-                                [{f['description']}]({f['link']})
-                                """)
-                        else:
-                            st.caption(f"No filings found matching selected types: {', '.join(filing_types)}")
+                        for f in filings:
+                            st.markdown(f"""
+                            **{f['date']}** • `{f['type']}`  
+                            [{f['description']}]({f['link']})
+                            """)
+                    elif filing_types:
+                        st.caption(f"No filings found matching selected types: {', '.join(filing_types)}")
                     else:
                         st.caption("No recent filings found.")
 
@@ -185,12 +189,24 @@ if scan_clicked:
                 st.subheader("📰 Latest News", divider="gray")
                 if not news:
                     st.warning("No matches found.")
+                elif len(news) > NEWS_CARD_LIMIT:
+                    table = NewsBatch.from_items(news, scout.NEWS_SOURCES).to_pandas()
+                    st.dataframe(table[['date', 'source', 'headline', 'link']], hide_index=True,
+                                 use_container_width=True,
+                                 column_config={'date': st.column_config.DateColumn("Date"),
+                                                'link': st.column_config.LinkColumn("Link")})
                 else:
                     for item in news:
                         with st.container(border=True):
                             st.caption(f"{item['date']} • {item['source']}")
                             st.markdown(f"**[{item['headline']}]({item['link']})**")
 
+        if any(shown_news):
+            # "ignore": downloading must not rerun the script, which would clear the results above.
+            st.download_button("⬇️ Download News (CSV)", scout.news_batch(shown_news).to_csv(),
+                               file_name=f"news-{datetime.now():%Y%m%d}.csv", mime="text/csv",
+                               on_click="ignore")
+
 # Footer
 st.markdown("""
     <div class="footer">
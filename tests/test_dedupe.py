@@ -0,0 +1,90 @@
+"""
+scout.canonical_url, scout.dedupe_news and the news store's handling of the
+same link recorded by several sources:
+
+    python -m pytest tests
+"""
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import scout
+import store
+
+def _item(headline, link, source='Yahoo/Aggregate', date='2026-10-05', ticker='ACME'):
+    return {'ticker': ticker, 'date': date, 'headline': headline, 'link': link, 'source': source}
+
+def test_canonical_url_drops_tracking_and_normalizes():
+    assert (scout.canonical_url("HTTPS://WWW.BusinessWire.com/news/home/2026/?utm_source=yahoo&utm_medium=rss&id=7")
+            == "https://businesswire.com/news/home/2026?id=7")
+    assert scout.canonical_url("https://example.com/a?fbclid=xyz&guccounter=1") == "https://example.com/a"
+    assert scout.canonical_url(" https://example.com/ ") == "https://example.com/"
+
+def test_canonical_url_unwraps_redirects():
+    wrapped = "https://out.reddit.com/t3_abc?url=https%3A%2F%2Fwww.example.com%2Fnews%3Futm_campaign%3Dx&token=1"
+    assert scout.canonical_url(wrapped) == "https://example.com/news"
+    yahoo = "https://r.search.yahoo.com/_ylt=A/RV=2/RE=1/RO=10/RU=https%3a%2f%2fexample.com%2fpr%2f1/RK=2/RS=x"
+    assert scout.canonical_url(yahoo) == "https://example.com/pr/1"
+
+def test_canonical_url_keeps_fragments():
+    assert scout.canonical_url("https://ir.example.com/#/news/12") != scout.canonical_url("https://ir.example.com/#/news/13")
+    assert scout.canonical_url("https://ir.example.com/news#!id=3") == "https://ir.example.com/news#!id=3"
+
+def test_dedupe_prefers_official_ir_for_the_same_url():
+    items = [
+        _item("Acme Reports Third Quarter Results", "https://www.businesswire.com/news/1/?utm_source=yahoo"),
+        _item("Acme Reports Third Quarter Results", "https://businesswire.com/news/1", source='Official IR'),
+    ]
+    assert [i['source'] for i in scout.dedupe_news(items)] == ['Official IR']
+
+def test_dedupe_merges_near_identical_headlines_within_max_days():
+    items = [
+        _item("Acme Corp announces $2 billion share buyback program", "https://a.com/1", date='2026-10-05'),
+        _item("Acme Corp announces $2 billion share buyback program today", "https://b.com/2",
+              source='Official IR', date='2026-10-04'),
+        _item("Acme Corp announces $2 billion share buyback program", "https://c.com/3", date='2026-09-20'),
+        _item("Acme opens a new factory in Ohio", "https://d.com/4", date='2026-10-05'),
+    ]
+    kept = scout.dedupe_news(items)
+    assert [i['link'] for i in kept] == ["https://b.com/2", "https://c.com/3", "https://d.com/4"]
+
+def test_dedupe_does_not_chain_across_dates():
+    # The same headline every other day: each story only merges with neighbours
+    # of its cluster's first item, not transitively across the month.
+    items = [_item("Daily Discussion Thread for today", f"https://reddit.com/r/wsb/{day}", source='Reddit/WSB',
+                   date=f"2026-10-{day:02d}") for day in range(31, 0, -2)]
+    kept = scout.dedupe_news(items)
+    assert len(kept) == 8
+    assert [i['date'] for i in kept] == [f"2026-10-{day:02d}" for day in range(31, 0, -4)]
+
+def test_dedupe_scales_with_large_clusters():
+    rng = random.Random(0)
+    words = [f"w{i}" for i in range(5000)]
+    items = [_item("Company announces quarterly dividend payment" if i % 2 else " ".join(rng.sample(words, 8)),
+                   f"https://e.com/{i}") for i in range(6000)]
+    started = datetime.now()
+    kept = scout.dedupe_news(items)
+    assert len(kept) == 3001
+    assert datetime.now() - started < timedelta(seconds=10)
+
+def test_store_keeps_the_higher_priority_copy_of_a_link(tmp_path, monkeypatch):
+    news_store = store.NewsStore(str(tmp_path / "scout.db"))
+    monkeypatch.setattr(scout, "get_news_store", lambda: news_store)
+    cutoff = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    yahoo = _item("Acme Reports Third Quarter Results", "https://www.businesswire.com/news/1/?utm_source=yahoo")
+    official = _item("Acme Reports Third Quarter Results", "https://businesswire.com/news/1", source='Official IR')
+    reddit = _item("Acme Q3 results are out", "https://businesswire.com/news/1", source='Reddit/WSB')
+
+    # Yahoo finishes first, then the IR page, then Reddit with the same link.
+    assert scout._run(scout._arecord_news('ACME', 'Yahoo/Aggregate', [yahoo], cutoff)) == 1
+    assert scout._run(scout._arecord_news('ACME', 'Official IR', [official], cutoff)) == 0
+    assert scout._run(scout._arecord_news('ACME', 'Reddit/WSB', [reddit], cutoff)) == 0
+
+    items, total = news_store.query('ACME', '2026-10-01')
+    assert total == 1
+    assert [(i['source'], i['link']) for i in scout.dedupe_news(items)] == [('Official IR', official['link'])]
+    news_store.close()
@@ -0,0 +1,99 @@
+"""
+edgar.TickerIndex and edgar.Submissions against the recorded SEC fixtures in
+benchmarks/fixtures/sec (the same files the replay server serves):
+
+    python -m pytest tests
+"""
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import edgar
+
+SEC_FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures", "sec")
+CIK = 9900001
+
+def _fixture(name, ticker="T001", cik=CIK):
+    """A fixture with its {{TICKER}}/{{ticker}}/{{cik}} placeholders filled in, as parsed JSON."""
+    with open(os.path.join(SEC_FIXTURES, name)) as f:
+        body = f.read()
+    body = body.replace("{{TICKER}}", ticker.upper()).replace("{{ticker}}", ticker.lower())
+    return json.loads(body.replace("{{cik}}", f"{cik:010d}"))
+
+def _accession(n):
+    return f"{CIK:010d}-26-{n:06d}"
+
+def test_ticker_index_lookups():
+    index = edgar.TickerIndex.load(os.path.join(SEC_FIXTURES, "company_tickers.json"))
+    assert len(index) == 110
+    assert index.cik("AAPL") == 320193
+    assert index.title("AAPL") == "Apple Inc."
+    assert index.cik("T001") == CIK
+    assert index.cik("NOPE") is None and index.title("NOPE") is None
+    assert "T001" in index and "NOPE" not in index
+
+def test_ticker_index_share_classes():
+    index = edgar.TickerIndex.from_json(_fixture("company_tickers.json"))
+    assert index.cik("BRK.B") == index.cik("brk-b") == 1067983
+    assert "BRK.B" in index
+
+def test_ticker_index_exchange_format():
+    data = {'fields': ["cik", "name", "ticker", "exchange"],
+            'data': [[1067983, "BERKSHIRE HATHAWAY INC", "BRK-B", "NYSE"], [320193, "Apple Inc.", "AAPL", "Nasdaq"]]}
+    index = edgar.TickerIndex.from_json(json.dumps(data))
+    assert len(index) == 2
+    assert index.cik("BRK.B") == 1067983
+    assert index.title("aapl") == "Apple Inc."
+
+def test_submissions_first_update():
+    registrant = edgar.Submissions(CIK)
+    assert registrant.update(_fixture("submissions.json")) == 120
+    assert registrant.name == "T001 Corp"
+    assert registrant.website is None and registrant.investor_website is None
+    assert registrant.unloaded_pages() == [f"CIK{CIK:010d}-submissions-001.json"]
+    dates = [row['date'] for row in registrant.filings]
+    assert dates == sorted(dates, reverse=True)
+    newest = registrant.filings[0]
+    assert newest['type'] == "8-K" and newest['description'] == "Current report"
+    assert newest['link'] == f"{edgar.ARCHIVES_URL}/{CIK}/{_accession(0).replace('-', '')}/t001-000000.htm"
+
+def test_submissions_update_stops_at_known_accession():
+    registrant = edgar.Submissions(CIK)
+    data = _fixture("submissions.json")
+    registrant.update(data)
+
+    # Two new filings on top; the rest of `recent` is already held.
+    recent = data['filings']['recent']
+    for name, values in recent.items():
+        recent[name] = values[:2] + values
+    recent['accessionNumber'][:2] = [_accession(900), _accession(901)]
+    recent['filingDate'][:2] = ["2026-10-02", "2026-10-01"]
+    assert registrant.update(data) == 2
+    assert len(registrant.filings) == 122
+    assert [row['date'] for row in registrant.select(3)] == ["2026-10-02", "2026-10-01", "2026-09-30"]
+
+    # Parsing stops at the first known accession, even if unknown ones follow it.
+    recent['accessionNumber'][0] = _accession(902)
+    recent['accessionNumber'][5] = _accession(903)
+    assert registrant.update(data) == 1
+    assert len(registrant.filings) == 123
+    assert _accession(902) in registrant.accessions and _accession(903) not in registrant.accessions
+
+def test_submissions_add_page_merges_older_filings():
+    registrant = edgar.Submissions(CIK)
+    registrant.update(_fixture("submissions.json"))
+    page = registrant.unloaded_pages()[0]
+    newest_recent = registrant.filings[0]
+
+    assert registrant.add_page(page, json.dumps(_fixture("submissions_page.json"))) == 80
+    assert registrant.unloaded_pages() == []
+    assert len(registrant.filings) == 200
+    assert registrant.filings[0] == newest_recent
+    dates = [row['date'] for row in registrant.filings]
+    assert dates == sorted(dates, reverse=True)
+    assert registrant.add_page(page, _fixture("submissions_page.json")) == 0
+    assert len(registrant.filings) == 200
+    assert all(row['type'] == "10-Q" for row in registrant.select(None, form_types=["10-Q"]))